@@ -0,0 +1,35 @@
+"""add portfolio dividends_received
+
+Revision ID: 4b7e2c91d5a3
+Revises: 088ecdb87c56
+Create Date: 2026-10-17 09:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2c91d5a3'
+down_revision: Union[str, Sequence[str], None] = '088ecdb87c56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('portfolios', sa.Column('dividends_received', sa.Float(), server_default='0', nullable=False))
+    # Backfill from the existing dividend history
+    op.execute(
+        "UPDATE portfolios SET dividends_received = ("
+        "SELECT COALESCE(SUM(d.dividend_amount), 0) "
+        "FROM portfolio_dividend_histories d "
+        "WHERE d.portfolio_id = portfolios.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('portfolios', 'dividends_received')
@@ -0,0 +1,28 @@
+"""add watchlist items_version
+
+Revision ID: 9c3f5a1e7b20
+Revises: 4b7e2c91d5a3
+Create Date: 2026-10-17 14:05:47.118392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3f5a1e7b20'
+down_revision: Union[str, Sequence[str], None] = '4b7e2c91d5a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('watchlists', sa.Column('items_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('watchlists', 'items_version')
@@ -54,7 +54,7 @@ async def handle_pubsub_message(
         # Decode the Pub/Sub message
         try:
             message_payload = pubsub_handler.decode_pubsub_message(body)
-        except ValueError as e:
+        except (ValueError, TypeError) as e:
             logger.error(f"Invalid message format: {str(e)}")
             raise HTTPException(status_code=400, detail=str(e))
 
@@ -1,11 +1,13 @@
 from logging import getLogger
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.dependencies import get_db_session
 from app.dependencies.auth import get_current_user
+from app.repositories.dto import WatchlistCompanyItemDTO
 from app.schemas.user import (
     UserRead,
     WatchlistCompanyItem,
@@ -19,6 +21,9 @@ logger = getLogger(__name__)
 
 router = APIRouter(prefix="")
 
+# Serializes trusted service output straight to JSON bytes
+_WATCHLIST_ITEMS_ADAPTER = TypeAdapter(list[WatchlistCompanyItemDTO])
+
 
 def get_watchlist_service(
     session: Session = Depends(get_db_session),
@@ -181,13 +186,20 @@ async def get_watchlist_items(
         List[WatchlistCompanyItem]: List of watchlist items with company details
     """
     try:
-        return service.get_watchlist_items(watchlist_id, user_id=current_user.id)
+        items = service.get_watchlist_items(watchlist_id, user_id=current_user.id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e),
         )
 
+    # Returning a Response skips FastAPI's response_model re-validation and
+    # jsonable_encoder pass; response_model is kept for the OpenAPI schema
+    return Response(
+        content=_WATCHLIST_ITEMS_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
+
 
 @router.post(
     "/{watchlist_id}/items",
@@ -224,6 +236,44 @@ async def add_watchlist_item(
         )
 
 
+@router.post(
+    "/{watchlist_id}/items/bulk",
+    response_model=list[WatchlistCompanyItem],
+    summary="Add several items to a watchlist",
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_add_watchlist_items(
+    watchlist_id: int,
+    watchlist_items_in: list[WatchlistItemWrite],
+    current_user: Annotated[UserRead, Depends(get_current_user)],
+    service: WatchlistService = Depends(get_watchlist_service),
+):
+    """
+    Add several stock symbols to a watchlist in one request. Symbols already in
+    the watchlist are skipped. Only the owner can add items to their watchlist.
+
+    Args:
+        watchlist_id (int): The ID of the watchlist
+        watchlist_items_in (list[WatchlistItemWrite]): The items to add
+        current_user (UserRead): The authenticated user
+        service (WatchlistService): Injected watchlist service
+
+    Returns:
+        List[WatchlistCompanyItem]: The newly added items with company details
+    """
+    try:
+        return service.bulk_add_watchlist_items(
+            watchlist_id,
+            [item.symbol for item in watchlist_items_in],
+            user_id=current_user.id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+
+
 @router.delete(
     "/{watchlist_id}/items/{item_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import Any, Dict, Optional
+import threading
 import time
 from dataclasses import dataclass
 
@@ -104,6 +105,8 @@ class FMPClient:
         self.BASE_URL = self.config.base_url
         self.timeout = self.config.timeout
         self._last_request_time = 0
+        # The client is shared by concurrent sync workers
+        self._rate_limit_lock = threading.Lock()
 
     def get_stock_screeners(self, params: dict) -> list[FMPStockScreenResult]:
         """Fetches stock screener results based on provided parameters.
@@ -707,12 +710,13 @@ class FMPClient:
 
     def _apply_rate_limiting(self) -> None:
         """Apply rate limiting to prevent API throttling"""
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
-        if time_since_last_request < self.config.rate_limit_delay:
-            sleep_time = self.config.rate_limit_delay - time_since_last_request
-            time.sleep(sleep_time)
-        self._last_request_time = time.time()
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self._last_request_time
+            if time_since_last_request < self.config.rate_limit_delay:
+                sleep_time = self.config.rate_limit_delay - time_since_last_request
+                time.sleep(sleep_time)
+            self._last_request_time = time.time()
 
     def __get_by_url(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
@@ -50,6 +50,10 @@ class Portfolio(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str] = mapped_column(String(255), nullable=True)
     currency: Mapped[Currency] = mapped_column(nullable=False, default=Currency.USD)
+    # Running total of dividend_histories.dividend_amount, kept in sync on dividend writes
+    dividends_received: Mapped[float] = mapped_column(
+        nullable=False, default=0.0, server_default="0"
+    )
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True, default=None
     )
@@ -101,11 +105,6 @@ class Portfolio(Base):
         """Calculate total gain/loss across all holdings."""
         return self.total_value - self.total_invested
 
-    @property
-    def dividends_received(self) -> float:
-        """Calculate total dividends received."""
-        return sum(dividend.dividend_amount for dividend in self.dividend_histories)
-
     @property
     def total_return_percentage(self) -> float:
         """Calculate total return percentage including dividends."""
@@ -25,6 +25,10 @@ class Watchlist(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     currency: Mapped[str] = mapped_column(String(10), nullable=False, default="USD")
     description: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Bumped on every item write; cache key for the watchlist items
+    items_version: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
@@ -99,7 +103,7 @@ class WatchlistItem(Base):
         """Fetch company profile from database."""
         # Return pre-loaded profile if available
         if hasattr(self, "_company_profile"):
-            logger.info(f"Using pre-loaded company profile for {self.symbol}")
+            logger.debug("Using pre-loaded company profile for %s", self.symbol)
             return self._company_profile
 
         logger.info(
@@ -111,7 +115,7 @@ class WatchlistItem(Base):
         """Fetch latest financial ratios for this symbol using repository logic."""
         # Return pre-loaded ratios if available
         if hasattr(self, "_financial_ratios"):
-            logger.info(f"Using pre-loaded financial ratios for {self.symbol}")
+            logger.debug("Using pre-loaded financial ratios for %s", self.symbol)
             return self._financial_ratios
 
         logger.info(
@@ -123,7 +127,7 @@ class WatchlistItem(Base):
         """Fetch the latest stock price from the database."""
         # Return pre-loaded price if available
         if hasattr(self, "_current_price"):
-            logger.info(f"Using pre-loaded current price for {self.symbol}")
+            logger.debug("Using pre-loaded current price for %s", self.symbol)
             return self._current_price
 
         logger.info(
@@ -135,7 +139,7 @@ class WatchlistItem(Base):
         """Fetch the latest price change from the database."""
         # Return pre-loaded price change if available
         if hasattr(self, "_price_change"):
-            logger.info(f"Using pre-loaded price change for {self.symbol}")
+            logger.debug("Using pre-loaded price change for %s", self.symbol)
             return self._price_change
 
         logger.info(
@@ -147,7 +151,7 @@ class WatchlistItem(Base):
         """Fetch the latest price change percent from the database."""
         # Return pre-loaded price change percent if available
         if hasattr(self, "_price_change_percent"):
-            logger.info(f"Using pre-loaded price change percent for {self.symbol}")
+            logger.debug("Using pre-loaded price change percent for %s", self.symbol)
             return self._price_change_percent
 
         logger.info(
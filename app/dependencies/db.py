@@ -1,9 +1,21 @@
+from collections.abc import Callable
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
 from app.db.engine import SessionLocal
 
 
-def get_db_session():
+def get_session_factory() -> Callable[[], Session]:
+    """Dependency that provides the factory for new database sessions."""
+    return SessionLocal
+
+
+def get_db_session(
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+):
     """Dependency that provides a database session."""
-    db = SessionLocal()
+    db = session_factory()
     try:
         yield db
     finally:
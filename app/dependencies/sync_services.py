@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from app.clients.fmp.protocol import FMPClientProtocol
 from app.clients.yfinance.protocol import YFinanceClientProtocol
 from app.core.config import config
-from app.dependencies.db import get_db_session
+from app.dependencies.db import get_db_session, get_session_factory
 from app.dependencies.market_api import get_fmp_client, get_yfinance_client
 from app.repositories.company_repo import CompanyRepository
 from app.services.internal.base_sync_service import BaseSyncService
@@ -135,19 +135,36 @@ def get_company_sync_service(
 
 
 def get_pubsub_handler(
-    company_sync_service: CompanySyncService = Depends(get_company_sync_service),
+    fmp_client: FMPClientProtocol = Depends(get_fmp_client),
+    yfinance_client: YFinanceClientProtocol = Depends(get_yfinance_client),
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
 ) -> PubSubHandler:
     """
     Provides a PubSubHandler instance with all required sync services.
 
+    The handler syncs symbols concurrently, so it receives a factory that
+    binds a CompanySyncService to each worker's own session instead of a
+    single request-scoped service.
+
     Args:
-        company_sync_service: CompanySyncService instance (injected via Depends)
+        fmp_client: FMP API client for US company data (injected via Depends)
+        yfinance_client: YFinance API client for non-US company data (injected via Depends)
+        session_factory: Creates each worker's database session (injected via Depends)
 
     Returns:
         Initialized PubSubHandler instance
     """
+
+    def build_company_sync_service(session: Session) -> CompanySyncService:
+        return CompanySyncService(
+            fmp_client=fmp_client,
+            yfinance_client=yfinance_client,
+            session=session,
+        )
+
     return PubSubHandler(
-        company_sync_service=company_sync_service,
+        company_sync_service_factory=build_company_sync_service,
+        session_factory=session_factory,
     )
 
 
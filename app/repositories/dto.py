@@ -4,6 +4,7 @@ These DTOs provide type-safe, explicit contracts for data returned from reposito
 They prevent lazy-loading issues and decouple the service layer from ORM models.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 
 from pydantic import BaseModel
@@ -63,3 +64,30 @@ class WatchlistUpdateDTO(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+@dataclass(slots=True, frozen=True)
+class WatchlistCompanyItemDTO:
+    """Lightweight internal form of WatchlistCompanyItem built per watchlist row.
+
+    Mirrors app.schemas.user.WatchlistCompanyItem field for field; the API
+    layer serializes it against that schema.
+    """
+
+    id: int
+    symbol: str
+    company_name: str
+    # Price fields come from nullable columns or a missing price row
+    price: float | None
+    currency: str
+    price_change: float | None
+    price_change_percent: float | None
+    market_cap: float
+    price_to_earnings_ratio: float | None = None
+    price_to_earnings_growth_ratio: float | None = None
+    forward_price_to_earnings_growth_ratio: float | None = None
+    price_to_book_ratio: float | None = None
+    price_to_sales_ratio: float | None = None
+    price_to_free_cash_flow_ratio: float | None = None
+    price_to_operating_cash_flow_ratio: float | None = None
+    image: str | None = None
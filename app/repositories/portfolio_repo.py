@@ -4,7 +4,7 @@ import logging
 from datetime import date as date_type
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session, selectinload
 
 from app.db.models.company import Company
@@ -123,11 +123,19 @@ class PortfolioRepository:
     def get_trading_history_before_date(
         self, portfolio_id: int, symbol: str, before_date
     ) -> list[PortfolioTradingHistory]:
-        """Get all trades for a symbol before a specific date."""
-        stmt = select(PortfolioTradingHistory).where(
-            (PortfolioTradingHistory.portfolio_id == portfolio_id)
-            & (PortfolioTradingHistory.symbol == symbol)
-            & (PortfolioTradingHistory.trade_date < before_date)
+        """Get all trades for a symbol before a specific date.
+
+        Served by ix_portfolio_symbol_trade_date as a range scan; ordering on
+        trade_date follows the index so no extra sort is needed.
+        """
+        stmt = (
+            select(PortfolioTradingHistory)
+            .where(
+                (PortfolioTradingHistory.portfolio_id == portfolio_id)
+                & (PortfolioTradingHistory.symbol == symbol)
+                & (PortfolioTradingHistory.trade_date < before_date)
+            )
+            .order_by(PortfolioTradingHistory.trade_date)
         )
         return self._db.execute(stmt).scalars().all()
 
@@ -312,6 +320,7 @@ class PortfolioRepository:
             .first()
         )
 
+        previous_amount = existing.dividend_amount if existing else 0.0
         if existing:
             # Update existing
             map_model(existing, dividend_record)
@@ -323,12 +332,85 @@ class PortfolioRepository:
             )
             self._db.add(record)
 
+        self._increment_dividends_received(
+            {record.portfolio_id: record.dividend_amount - previous_amount}
+        )
         self._db.commit()
         logger.info(
             f"Recorded dividend for {record.symbol} in portfolio {record.portfolio_id}"
         )
         return record
 
+    def add_dividends(
+        self, dividend_records: list[PortfolioDividendHistoryWrite]
+    ) -> list[PortfolioDividendHistory]:
+        """
+        Record a batch of dividends for a portfolio in a single transaction.
+
+        Existing records (same portfolio, symbol and payment date) are loaded with
+        one query and updated in place; new records are inserted together and
+        committed once instead of per dividend.
+        """
+        if not dividend_records:
+            return []
+
+        portfolio_ids = {record.portfolio_id for record in dividend_records}
+        symbols = {record.symbol for record in dividend_records}
+        stmt = select(PortfolioDividendHistory).where(
+            PortfolioDividendHistory.portfolio_id.in_(portfolio_ids)
+            & PortfolioDividendHistory.symbol.in_(symbols)
+        )
+        existing_by_key = {
+            (record.portfolio_id, record.symbol, record.payment_date): record
+            for record in self._db.execute(stmt).scalars().all()
+        }
+
+        records = []
+        new_records = []
+        deltas: dict[int, float] = {}
+        for dividend_record in dividend_records:
+            key = (
+                dividend_record.portfolio_id,
+                dividend_record.symbol,
+                dividend_record.payment_date,
+            )
+            record = existing_by_key.get(key)
+            previous_amount = record.dividend_amount if record else 0.0
+            if record:
+                map_model(record, dividend_record)
+            else:
+                record = PortfolioDividendHistory(
+                    **dividend_record.model_dump(exclude_unset=True)
+                )
+                existing_by_key[key] = record
+                new_records.append(record)
+            records.append(record)
+            deltas[record.portfolio_id] = (
+                deltas.get(record.portfolio_id, 0.0)
+                + record.dividend_amount
+                - previous_amount
+            )
+
+        self._db.add_all(new_records)
+        self._increment_dividends_received(deltas)
+        self._db.commit()
+        logger.info(
+            f"Recorded {len(records)} dividends ({len(new_records)} new) "
+            f"for portfolios {sorted(portfolio_ids)}"
+        )
+        return records
+
+    def _increment_dividends_received(self, deltas: dict[int, float]) -> None:
+        """Apply dividend amount deltas to the cached Portfolio.dividends_received."""
+        for portfolio_id, delta in deltas.items():
+            if not delta:
+                continue
+            self._db.execute(
+                update(Portfolio)
+                .where(Portfolio.id == portfolio_id)
+                .values(dividends_received=Portfolio.dividends_received + delta)
+            )
+
     def _load_company_profiles_for_items(
         self, holdings: list[PortfolioHoldingPerformance]
     ) -> dict[str, dict]:
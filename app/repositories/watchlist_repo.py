@@ -1,9 +1,9 @@
 import logging
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import delete, exists, func, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only, selectinload
 
 from app.db.models.company import Company
 from app.db.models.quote import CompanyStockPrice
@@ -14,7 +14,6 @@ from app.schemas.user import (
     WatchlistItemCreate,
     WatchlistUpdate,
 )
-from app.util.model_mapper import map_model
 
 if TYPE_CHECKING:
     from app.db.models.company import Company
@@ -29,11 +28,12 @@ class WatchlistRepository:
     def verify_watchlist_ownership(self, watchlist_id: int, user_id: int) -> bool:
         """Verify that a watchlist belongs to a specific user."""
         try:
-            stmt = select(Watchlist).where(
-                Watchlist.id == watchlist_id, Watchlist.user_id == user_id
+            stmt = select(
+                exists().where(
+                    Watchlist.id == watchlist_id, Watchlist.user_id == user_id
+                )
             )
-            watchlist = self._db.execute(stmt).scalar_one_or_none()
-            return watchlist is not None
+            return bool(self._db.execute(stmt).scalar())
         except SQLAlchemyError as e:
             logger.error(f"Error verifying watchlist ownership: {e}")
             raise
@@ -41,16 +41,66 @@ class WatchlistRepository:
     def check_watchlist_item_exists(self, watchlist_id: int, symbol: str) -> bool:
         """Check if a watchlist item with the given symbol already exists in the watchlist."""
         try:
-            stmt = select(WatchlistItem).where(
-                WatchlistItem.watchlist_id == watchlist_id,
-                WatchlistItem.symbol == symbol,
+            stmt = select(
+                exists().where(
+                    WatchlistItem.watchlist_id == watchlist_id,
+                    WatchlistItem.symbol == symbol,
+                )
             )
-            item = self._db.execute(stmt).scalar_one_or_none()
-            return item is not None
+            return bool(self._db.execute(stmt).scalar())
         except SQLAlchemyError as e:
             logger.error(f"Error checking watchlist item existence: {e}")
             raise
 
+    def check_owned_watchlist_item_exists(
+        self, watchlist_id: int, user_id: int, symbol: str
+    ) -> bool | None:
+        """
+        Check ownership and symbol presence for a watchlist in a single query.
+
+        Returns None if the watchlist does not belong to the user, otherwise
+        whether the symbol is already in the watchlist.
+        """
+        try:
+            stmt = select(
+                exists().where(
+                    WatchlistItem.watchlist_id == Watchlist.id,
+                    WatchlistItem.symbol == symbol,
+                )
+            ).where(Watchlist.id == watchlist_id, Watchlist.user_id == user_id)
+            row = self._db.execute(stmt).first()
+            return bool(row[0]) if row else None
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking watchlist item existence: {e}")
+            raise
+
+    def get_watchlist_items_version(
+        self, watchlist_id: int, user_id: int
+    ) -> int | None:
+        """
+        Get a cheap change marker for a watchlist's items.
+
+        Returns items_version for a watchlist owned by the user, or None when
+        the watchlist does not exist or belongs to someone else. Every item
+        write increments it through _touch_watchlist.
+        """
+        stmt = select(Watchlist.items_version).where(
+            Watchlist.id == watchlist_id, Watchlist.user_id == user_id
+        )
+        return self._db.execute(stmt).scalar_one_or_none()
+
+    def _touch_watchlist(self, watchlist_id: int) -> None:
+        """Increment items_version so cached items for this watchlist are invalidated."""
+        self._db.execute(
+            update(Watchlist)
+            .where(Watchlist.id == watchlist_id)
+            .values(
+                items_version=Watchlist.items_version + 1,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     def get_all_watchlists(self, user_id: int) -> list[Watchlist]:
         """Get all watchlists for a specific user (lightweight)."""
         stmt = select(Watchlist).where(Watchlist.user_id == user_id)
@@ -60,26 +110,21 @@ class WatchlistRepository:
         self, watchlist_id: int, user_id: int
     ) -> Watchlist | None:
         """Get a watchlist by its ID, loading related items with pre-loaded company data."""
-        stmt = select(Watchlist).where(
-            Watchlist.id == watchlist_id, Watchlist.user_id == user_id
+        stmt = (
+            select(Watchlist)
+            .where(Watchlist.id == watchlist_id, Watchlist.user_id == user_id)
+            .options(selectinload(Watchlist.items))
         )
         watchlist = self._db.execute(stmt).scalar_one_or_none()
 
         if not watchlist:
             return None
 
-        # Store items in a local variable to avoid re-accessing the relationship
+        # Items were eagerly loaded with the watchlist, no lazy load here
         items = list(watchlist.items)
 
         if items:
-            # Pre-load all company data (prices, metrics, ratios) in bulk
-            profile_map = self.load_company_profiles_for_items(items)
-
-            # Inject pre-loaded data into each item (no more DB queries!)
-            for item in items:
-                target = profile_map.get(item.symbol)
-                if target:
-                    item.set_company_profile(target)
+            self.attach_company_profiles(items)
 
         return watchlist
 
@@ -103,14 +148,24 @@ class WatchlistRepository:
         if not item:
             return None
 
-        # Pre-load company profile for this item
-        profile_map = self.load_company_profiles_for_items([item])
-        target = profile_map.get(item.symbol)
-        if target:
-            item.set_company_profile(target)
+        return self.attach_company_profile(item)
 
+    def attach_company_profile(self, item: WatchlistItem) -> WatchlistItem:
+        """Pre-load company data onto a single already-fetched watchlist item."""
+        self.attach_company_profiles([item])
         return item
 
+    def attach_company_profiles(self, items: list[WatchlistItem]) -> None:
+        """Pre-load company data onto already-fetched watchlist items in bulk."""
+        # Pre-load all company data (prices, metrics, ratios) in bulk
+        profile_map = self.load_company_profiles_for_items(items)
+
+        # Inject pre-loaded data into each item (no more DB queries!)
+        for item in items:
+            target = profile_map.get(item.symbol)
+            if target:
+                item.set_company_profile(target)
+
     def create_watchlist(self, watchlist_in: WatchlistCreate) -> WatchlistCreateDTO:
         """Create a new watchlist. Returns DTO with watchlist data."""
         watchlist = Watchlist(**watchlist_in.model_dump(exclude_unset=True))
@@ -144,18 +199,27 @@ class WatchlistRepository:
         self, watchlist_in: WatchlistUpdate, user_id: int
     ) -> WatchlistUpdateDTO | None:
         """Update a watchlist. Returns DTO with updated watchlist data."""
-        watchlist_exist = (
-            self._db.query(Watchlist)
-            .filter_by(id=watchlist_in.id, user_id=user_id)
-            .first()
+        # Ownership is enforced by the WHERE clause, so no separate lookup
+        stmt = (
+            update(Watchlist)
+            .where(Watchlist.id == watchlist_in.id, Watchlist.user_id == user_id)
+            .values(
+                **watchlist_in.model_dump(include={"name", "currency", "description"})
+            )
+            .execution_options(synchronize_session=False)
         )
+        result = self._db.execute(stmt)
 
-        if not watchlist_exist:
+        if not result.rowcount:
             logger.warning(f"Watchlist {watchlist_in.id} not found for user {user_id}")
             return None
 
-        map_model(watchlist_exist, watchlist_in)
-        self._db.flush()
+        self._db.commit()
+
+        # MySQL has no UPDATE ... RETURNING; read back the refreshed timestamps
+        watchlist_exist = self._db.execute(
+            select(Watchlist).where(Watchlist.id == watchlist_in.id)
+        ).scalar_one()
 
         # Extract all values while still in session
         watchlist_id = watchlist_exist.id
@@ -166,7 +230,6 @@ class WatchlistRepository:
         watchlist_created_at = watchlist_exist.created_at
         watchlist_updated_at = watchlist_exist.updated_at
 
-        self._db.commit()
         logger.info(f"Updated watchlist {watchlist_id}")
 
         # Return DTO with extracted values
@@ -219,7 +282,23 @@ class WatchlistRepository:
         symbols = list({item.symbol for item in items})
 
         # Query companies - basic fields only
-        stmt = select(Company).where(Company.symbol.in_(symbols))
+        stmt = (
+            select(Company)
+            .where(Company.symbol.in_(symbols))
+            .options(
+                load_only(
+                    Company.id,
+                    Company.symbol,
+                    Company.company_name,
+                    Company.market_cap,
+                    Company.currency,
+                    Company.exchange,
+                    Company.industry,
+                    Company.sector,
+                    Company.image,
+                )
+            )
+        )
         companies = self._db.execute(stmt).scalars().all()
 
         if not companies:
@@ -231,23 +310,43 @@ class WatchlistRepository:
         all_ratios = (
             self._db.query(CompanyFinancialRatio)
             .filter(CompanyFinancialRatio.company_id.in_(company_ids))
+            .options(
+                load_only(
+                    CompanyFinancialRatio.id,
+                    CompanyFinancialRatio.company_id,
+                    CompanyFinancialRatio.symbol,
+                    CompanyFinancialRatio.date,
+                    CompanyFinancialRatio.fiscal_year,
+                    CompanyFinancialRatio.period,
+                    CompanyFinancialRatio.price_to_earnings_ratio,
+                    CompanyFinancialRatio.price_to_earnings_growth_ratio,
+                    CompanyFinancialRatio.forward_price_to_earnings_growth_ratio,
+                    CompanyFinancialRatio.price_to_book_ratio,
+                    CompanyFinancialRatio.price_to_sales_ratio,
+                    CompanyFinancialRatio.price_to_free_cash_flow_ratio,
+                    CompanyFinancialRatio.price_to_operating_cash_flow_ratio,
+                )
+            )
             .all()
         )
 
+        # Single pass: latest ratio per (company, period)
+        latest_ratios: dict[int, dict[str, CompanyFinancialRatio]] = {}
+        for ratio in all_ratios:
+            ratios_by_period = latest_ratios.setdefault(ratio.company_id, {})
+            period = ratio.period
+            if period not in ratios_by_period or (
+                ratio.fiscal_year > ratios_by_period[period].fiscal_year
+                or (
+                    ratio.fiscal_year == ratios_by_period[period].fiscal_year
+                    and ratio.date > ratios_by_period[period].date
+                )
+            ):
+                ratios_by_period[period] = ratio
+
         ratios_by_company = {}
         for company in companies:
-            ratios_by_period = {}
-            for ratio in all_ratios:
-                if ratio.company_id == company.id:
-                    period = ratio.period
-                    if period not in ratios_by_period or (
-                        ratio.fiscal_year > ratios_by_period[period].fiscal_year
-                        or (
-                            ratio.fiscal_year == ratios_by_period[period].fiscal_year
-                            and ratio.date > ratios_by_period[period].date
-                        )
-                    ):
-                        ratios_by_period[period] = ratio
+            ratios_by_period = latest_ratios.get(company.id, {})
 
             # Prefer FY > Q4 > Q3 > Q2 > Q1
             periods = ["FY", "Q4", "Q3", "Q2", "Q1"]
@@ -262,6 +361,7 @@ class WatchlistRepository:
                         "fiscal_year": ratio.fiscal_year,
                         "period": ratio.period,
                         "price_to_earnings_ratio": ratio.price_to_earnings_ratio,
+                        "price_to_earnings_growth_ratio": ratio.price_to_earnings_growth_ratio,
                         "forward_price_to_earnings_growth_ratio": ratio.forward_price_to_earnings_growth_ratio,
                         "price_to_book_ratio": ratio.price_to_book_ratio,
                         "price_to_sales_ratio": ratio.price_to_sales_ratio,
@@ -279,15 +379,33 @@ class WatchlistRepository:
                 CompanyStockPrice.date.desc(),
             )
             .distinct(CompanyStockPrice.company_id)
+            .options(
+                load_only(
+                    CompanyStockPrice.id,
+                    CompanyStockPrice.company_id,
+                    CompanyStockPrice.symbol,
+                    CompanyStockPrice.date,
+                    CompanyStockPrice.open_price,
+                    CompanyStockPrice.close_price,
+                    CompanyStockPrice.high_price,
+                    CompanyStockPrice.low_price,
+                    CompanyStockPrice.volume,
+                    CompanyStockPrice.change,
+                    CompanyStockPrice.change_percent,
+                )
+            )
             .all()
         )
 
+        # Rows are ordered newest first per company, keep the first one seen
+        price_by_company: dict[int, CompanyStockPrice] = {}
+        for price in latest_prices:
+            price_by_company.setdefault(price.company_id, price)
+
         # Build result with plain dicts (no ORM objects)
         profiles = {}
         for company in companies:
-            price_obj = next(
-                (p for p in latest_prices if p.company_id == company.id), None
-            )
+            price_obj = price_by_company.get(company.id)
 
             profiles[company.symbol] = {
                 "id": company.id,
@@ -334,6 +452,7 @@ class WatchlistRepository:
         """Add an item to a watchlist."""
         item = WatchlistItem(**watchlist_item_in.model_dump(exclude_unset=True))
         self._db.add(item)
+        self._touch_watchlist(item.watchlist_id)
         self._db.commit()
 
         # Refresh only to get the generated ID, without loading relationships
@@ -342,29 +461,68 @@ class WatchlistRepository:
         logger.info(f"Added {item.symbol} to watchlist {item.watchlist_id}")
         return item
 
+    def get_existing_watchlist_symbols(
+        self, watchlist_id: int, symbols: list[str]
+    ) -> set[str]:
+        """Return which of the given symbols are already in the watchlist."""
+        stmt = select(WatchlistItem.symbol).where(
+            WatchlistItem.watchlist_id == watchlist_id,
+            WatchlistItem.symbol.in_(symbols),
+        )
+        return set(self._db.execute(stmt).scalars().all())
+
+    def bulk_add_watchlist_items(
+        self, watchlist_id: int, symbols: list[str]
+    ) -> list[WatchlistItem]:
+        """Add several symbols to a watchlist with one multi-row INSERT."""
+        if not symbols:
+            return []
+
+        self._db.execute(
+            insert(WatchlistItem),
+            [{"watchlist_id": watchlist_id, "symbol": symbol} for symbol in symbols],
+        )
+        self._touch_watchlist(watchlist_id)
+        self._db.commit()
+
+        # Auto-increment ids follow the VALUES order, so this matches symbols
+        stmt = (
+            select(WatchlistItem)
+            .where(
+                WatchlistItem.watchlist_id == watchlist_id,
+                WatchlistItem.symbol.in_(symbols),
+            )
+            .order_by(WatchlistItem.id)
+        )
+        items = list(self._db.execute(stmt).scalars().all())
+        logger.info(f"Added {len(items)} items to watchlist {watchlist_id}")
+        return items
+
     def delete_watchlist_item(
         self, watchlist_id: int, watchlist_item_id: int, user_id: int
     ) -> bool:
         """Delete a watchlist item, ensuring it belongs to a user's watchlist."""
-        # Join to verify ownership
-        item = (
-            self._db.query(WatchlistItem)
-            .join(Watchlist, WatchlistItem.watchlist_id == Watchlist.id)
-            .filter(
+        # Ownership is checked by the subquery, so this is a single statement
+        owned_watchlist = select(Watchlist.id).where(
+            Watchlist.id == watchlist_id, Watchlist.user_id == user_id
+        )
+        stmt = (
+            delete(WatchlistItem)
+            .where(
                 WatchlistItem.id == watchlist_item_id,
-                Watchlist.id == watchlist_id,
-                Watchlist.user_id == user_id,
+                WatchlistItem.watchlist_id.in_(owned_watchlist),
             )
-            .first()
+            .execution_options(synchronize_session=False)
         )
+        result = self._db.execute(stmt)
 
-        if not item:
+        if not result.rowcount:
             logger.warning(
                 f"Watchlist item {watchlist_item_id} not found or access denied"
             )
             return False
 
-        self._db.delete(item)
+        self._touch_watchlist(watchlist_id)
         self._db.commit()
         logger.info(f"Deleted watchlist item {watchlist_item_id}")
         return True
@@ -403,10 +403,10 @@ class WatchlistCompanyItem(BaseModel):
     id: int
     symbol: str
     company_name: str
-    price: float
+    price: Optional[float] = None
     currency: str
-    price_change: float
-    price_change_percent: float
+    price_change: Optional[float] = None
+    price_change_percent: Optional[float] = None
     market_cap: float
     price_to_earnings_ratio: Optional[float] = None
     price_to_earnings_growth_ratio: Optional[float] = None
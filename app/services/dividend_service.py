@@ -49,7 +49,7 @@ class DividendService:
             unprocessed_dividends = self._portfolio_repo.get_unprocessed_dividends(
                 after_date
             )
-            dividend_created = []
+            dividend_records = []
 
             for company_dividend in unprocessed_dividends:
                 symbol = company_dividend.symbol
@@ -62,8 +62,9 @@ class DividendService:
 
                 if not dividend_per_share or dividend_per_share <= 0:
                     logger.warning(
-                        f"Skipping dividend for {symbol} on {declaration_date}: "
-                        "Invalid dividend amount"
+                        "Skipping dividend for %s on %s: Invalid dividend amount",
+                        symbol,
+                        declaration_date,
                     )
                     continue
 
@@ -74,8 +75,10 @@ class DividendService:
 
                 if not trades:
                     logger.debug(
-                        f"No trades found for {symbol} before {declaration_date} "
-                        f"in portfolio {portfolio_id}"
+                        "No trades found for %s before %s in portfolio %s",
+                        symbol,
+                        declaration_date,
+                        portfolio_id,
                     )
                     continue
 
@@ -84,8 +87,10 @@ class DividendService:
 
                 if shares_held <= 0:
                     logger.debug(
-                        f"No shares held for {symbol} at {declaration_date} "
-                        f"in portfolio {portfolio_id}"
+                        "No shares held for %s at %s in portfolio %s",
+                        symbol,
+                        declaration_date,
+                        portfolio_id,
                     )
                     continue
 
@@ -100,8 +105,10 @@ class DividendService:
                     payment_date=payment_date,
                     currency=currency,
                 )
-                result = self._portfolio_repo.add_dividend(dividend_record)
-                dividend_created.append(result)
+                dividend_records.append(dividend_record)
+
+            # Persist all dividends together with a single commit
+            dividend_created = self._portfolio_repo.add_dividends(dividend_records)
             results = [
                 PortfolioDividendHistoryRead.model_validate(dividend)
                 for dividend in dividend_created
@@ -109,7 +116,9 @@ class DividendService:
             return results
         except Exception as e:
             logger.error(
-                f"Error syncing dividends for portfolio {portfolio_id}: {str(e)}",
+                "Error syncing dividends for portfolio %s: %s",
+                portfolio_id,
+                e,
                 exc_info=True,
             )
             raise
@@ -138,6 +147,6 @@ class DividendService:
             return results
         except Exception as e:
             logger.error(
-                f"Error syncing dividends for all portfolios: {str(e)}", exc_info=True
+                "Error syncing dividends for all portfolios: %s", e, exc_info=True
             )
             raise
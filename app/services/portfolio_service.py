@@ -1,5 +1,6 @@
 import logging
 
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from datetime import date as date_type
 
@@ -11,7 +12,6 @@ from app.schemas.user import (
     PortfolioCreate,
     PortfolioDetail,
     PortfolioDividendHistoryRead,
-    PortfolioDividendHistoryWrite,
     PortfolioHoldingPerformanceRead,
     PortfolioHoldingPerformanceWrite,
     PortfolioIndustryPerformanceRead,
@@ -27,6 +27,8 @@ from app.schemas.user import (
 
 logger = logging.getLogger(__name__)
 
+_PORTFOLIO_LIST_ADAPTER = TypeAdapter(list[PortfolioRead])
+
 
 class PortfolioService:
     """Service for managing portfolios and portfolio data."""
@@ -63,17 +65,7 @@ class PortfolioService:
         use get_portfolio_details() instead.
         """
         portfolios = self._portfolio_repo.get_all_portfolios(user_id)
-        return [
-            PortfolioRead(
-                id=p.id,
-                name=p.name,
-                description=p.description,
-                currency=p.currency,
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-            )
-            for p in portfolios
-        ]
+        return _PORTFOLIO_LIST_ADAPTER.validate_python(portfolios, from_attributes=True)
 
     def create_portfolio(
         self, portfolio_in: PortfolioUpsertRequest, user_id: int
@@ -86,15 +78,8 @@ class PortfolioService:
             user_id=user_id,
         )
         portfolio_dto = self._portfolio_repo.create_portfolio(portfolio_create)
-        logger.info(f"Created portfolio {portfolio_dto.id} for user {user_id}")
-        return PortfolioRead(
-            id=portfolio_dto.id,
-            name=portfolio_dto.name,
-            description=portfolio_dto.description,
-            currency=portfolio_dto.currency,
-            created_at=portfolio_dto.created_at,
-            updated_at=portfolio_dto.updated_at,
-        )
+        logger.info("Created portfolio %s for user %s", portfolio_dto.id, user_id)
+        return PortfolioRead.model_validate(portfolio_dto)
 
     def update_portfolio(
         self, portfolio_id: int, portfolio_in: PortfolioUpsertRequest, user_id: int
@@ -110,15 +95,8 @@ class PortfolioService:
             currency=portfolio_in.currency,
         )
         updated_dto = self._portfolio_repo.update_portfolio(portfolio_update)
-        logger.info(f"Updated portfolio {updated_dto.id} for user {user_id}")
-        return PortfolioRead(
-            id=updated_dto.id,
-            name=updated_dto.name,
-            description=updated_dto.description,
-            currency=updated_dto.currency,
-            created_at=updated_dto.created_at,
-            updated_at=updated_dto.updated_at,
-        )
+        logger.info("Updated portfolio %s for user %s", updated_dto.id, user_id)
+        return PortfolioRead.model_validate(updated_dto)
 
     def delete_portfolio(self, portfolio_id: int, user_id: int) -> bool:
         """Delete a portfolio (soft delete), ensuring it belongs to the authenticated user."""
@@ -126,7 +104,7 @@ class PortfolioService:
 
         success = self._portfolio_repo.soft_delete_portfolio(portfolio_id, user_id)
         if success:
-            logger.info(f"Deleted portfolio {portfolio_id} for user {user_id}")
+            logger.info("Deleted portfolio %s for user %s", portfolio_id, user_id)
         return success
 
     def get_portfolio_details(self, portfolio_id: int, user_id: int) -> PortfolioDetail:
@@ -150,6 +128,10 @@ class PortfolioService:
         trading_history = portfolio.trading_histories
         dividends = portfolio.dividend_histories
 
+        # Freshly created portfolios have nothing to aggregate
+        if not holdings and not trading_history and not dividends:
+            return PortfolioDetail()
+
         trading_history_read = self._validate_list(
             trading_history, PortfolioTradingHistoryRead
         )
@@ -162,25 +144,15 @@ class PortfolioService:
             trading_history_read, dividend_history_read
         )
 
-        # Calculate total dividends received
-        dividends_received = sum(d.dividend_amount for d in dividend_history_read)
-
-        company_sectors = {h.symbol: h.sector for h in holdings}
-        company_industries = {h.symbol: h.industry for h in holdings}
-
         # Calculate sector and industry performance on-the-fly
-        sector_performances = self._calculate_sector_performances(
-            holdings, company_sectors
-        )
-        industry_performances = self._calculate_industry_performances(
-            holdings, company_industries
-        )
+        sector_performances = self._calculate_sector_performances(holdings)
+        industry_performances = self._calculate_industry_performances(holdings)
 
         return PortfolioDetail(
             total_value=portfolio.total_value,
             total_invested=portfolio.total_invested,
             total_gain_loss=portfolio.total_gain_loss,
-            dividends_received=dividends_received,
+            dividends_received=portfolio.dividends_received,
             total_return_percentage=portfolio.total_return_percentage,
             holding_performances=self._validate_list(
                 holdings, PortfolioHoldingPerformanceRead
@@ -208,14 +180,11 @@ class PortfolioService:
         )
         if not portfolio:
             raise ValueError("Portfolio not found or access denied")
-        dividends_received = sum(
-            d.dividend_amount for d in portfolio.dividend_histories
-        )
         return PortfolioDetail(
             total_value=portfolio.total_value,
             total_invested=portfolio.total_invested,
             total_gain_loss=portfolio.total_gain_loss,
-            dividends_received=dividends_received,
+            dividends_received=portfolio.dividends_received,
             total_return_percentage=portfolio.total_return_percentage,
             holding_performances=[],
             trading_histories=[],
@@ -245,7 +214,9 @@ class PortfolioService:
             return results
         except Exception as e:
             logger.error(
-                f"Error retrieving dividend history for portfolio {portfolio_id}: {str(e)}",
+                "Error retrieving dividend history for portfolio %s: %s",
+                portfolio_id,
+                e,
                 exc_info=True,
             )
             raise
@@ -262,13 +233,14 @@ class PortfolioService:
 
         # Calculate totals
         trade_totals = self._calculate_trade_totals(trading, is_buy=True)
-        trade_data = trading.model_dump()
-        trade_data.update({**trade_totals, "portfolio_id": portfolio_id})
-
-        trade_write = PortfolioTradingHistoryWrite.model_validate(trade_data)
+        trade_write = self._build_trade_write(portfolio_id, trading, trade_totals)
         response = self._portfolio_repo.add_trade(trade_write)
         logger.info(
-            f"Recorded BUY trade: {trading.shares} shares of {trading.symbol} at ${trading.price_per_share} in portfolio {portfolio_id}"
+            "Recorded BUY trade: %s shares of %s at $%s in portfolio %s",
+            trading.shares,
+            trading.symbol,
+            trading.price_per_share,
+            portfolio_id,
         )
 
         # Ensure holding exists for this symbol
@@ -306,13 +278,14 @@ class PortfolioService:
 
         # Calculate totals
         trade_totals = self._calculate_trade_totals(trading, is_buy=False)
-        trade_data = trading.model_dump()
-        trade_data.update({**trade_totals, "portfolio_id": portfolio_id})
-
-        trade_write = PortfolioTradingHistoryWrite.model_validate(trade_data)
+        trade_write = self._build_trade_write(portfolio_id, trading, trade_totals)
         response = self._portfolio_repo.add_trade(trade_write)
         logger.info(
-            f"Recorded SELL trade: {trading.shares} shares of {trading.symbol} at ${trading.price_per_share} in portfolio {portfolio_id}"
+            "Recorded SELL trade: %s shares of %s at $%s in portfolio %s",
+            trading.shares,
+            trading.symbol,
+            trading.price_per_share,
+            portfolio_id,
         )
 
         # Sync dividends from trade date onwards
@@ -325,94 +298,13 @@ class PortfolioService:
         if holding.total_shares == trading.shares:
             self._portfolio_repo.delete_holding(holding.id)
             logger.info(
-                f"Removed holding {trading.symbol} from portfolio {portfolio_id} after selling all shares"
+                "Removed holding %s from portfolio %s after selling all shares",
+                trading.symbol,
+                portfolio_id,
             )
 
         return PortfolioTradingHistoryRead.model_validate(response)
 
-    def sync_dividends_for_portfolio(
-        self, portfolio_id: int, after_date: date_type | None = None
-    ) -> list[PortfolioDividendHistoryRead]:
-        """
-        Sync dividends for a specific portfolio.
-
-        Args:
-            portfolio_id: The portfolio to sync dividends for
-            after_date: Optional date to only process dividends after this date
-
-        Returns:
-            Dictionary with summary of processed dividends
-        """
-        # Get all unprocessed company dividends
-        try:
-            unprocessed_dividends = self._dividend_repo.get_unprocessed_dividends(
-                after_date
-            )
-            dividend_created = []
-
-            for company_dividend in unprocessed_dividends:
-                symbol = company_dividend.symbol
-                declaration_date = company_dividend.declaration_date
-                payment_date = company_dividend.payment_date
-                dividend_per_share = (
-                    company_dividend.adj_dividend or company_dividend.dividend
-                )
-                currency = company_dividend.currency
-
-                if not dividend_per_share or dividend_per_share <= 0:
-                    logger.warning(
-                        f"Skipping dividend for {symbol} on {declaration_date}: "
-                        "Invalid dividend amount"
-                    )
-                    continue
-
-                # Get all trades for this symbol before declaration date
-                trades = self._portfolio_repo.get_trading_history_before_date(
-                    portfolio_id, symbol, declaration_date
-                )
-
-                if not trades:
-                    logger.debug(
-                        f"No trades found for {symbol} before {declaration_date} "
-                        f"in portfolio {portfolio_id}"
-                    )
-                    continue
-
-                # Calculate shares held at declaration date
-                shares_held = self._calculate_shares_held(trades)
-
-                if shares_held <= 0:
-                    logger.debug(
-                        f"No shares held for {symbol} at {declaration_date} "
-                        f"in portfolio {portfolio_id}"
-                    )
-                    continue
-
-                # Record the dividend
-                dividend_record = PortfolioDividendHistoryWrite(
-                    portfolio_id=portfolio_id,
-                    symbol=symbol,
-                    shares=shares_held,
-                    dividend_per_share=dividend_per_share,
-                    dividend_amount=shares_held * dividend_per_share,
-                    declaration_date=declaration_date,
-                    payment_date=payment_date,
-                    currency=currency,
-                )
-                result = self._portfolio_repo.add_dividend(dividend_record)
-                dividend_created.append(result)
-            results = [
-                PortfolioDividendHistoryRead.model_validate(dividend)
-                for dividend in dividend_created
-            ]
-            return results
-        except Exception as e:
-            logger.error(
-                f"Error syncing dividends for portfolio {portfolio_id}: {str(e)}",
-                exc_info=True,
-            )
-            raise
-
     def _calculate_trade_totals(
         self, trading: PortfolioTradingHistoryUpsertRequest, is_buy: bool
     ) -> dict:
@@ -422,6 +314,18 @@ class PortfolioService:
         net_total = (total_value + fees) if is_buy else (total_value - fees)
         return {"total_value": total_value, "net_total": net_total}
 
+    @staticmethod
+    def _build_trade_write(
+        portfolio_id: int,
+        trading: PortfolioTradingHistoryUpsertRequest,
+        trade_totals: dict,
+    ) -> PortfolioTradingHistoryWrite:
+        """Build the write schema from an already-validated trade request."""
+        # The request was validated at the API boundary, so skip the dump/re-validate
+        return PortfolioTradingHistoryWrite.model_construct(
+            **{**trading.__dict__, **trade_totals, "portfolio_id": portfolio_id}
+        )
+
     def _ensure_holding_exists(
         self, portfolio_id: int, symbol: str, currency: str
     ) -> None:
@@ -436,14 +340,13 @@ class PortfolioService:
             self._portfolio_repo.add_holding(holding_write)
 
     def _calculate_sector_performances(
-        self, holdings: list, company_sectors: dict[str, str]
+        self, holdings: list
     ) -> list[PortfolioSectorPerformanceRead]:
         """
         Calculate sector performance from holdings on-the-fly.
 
         Args:
             holdings: List of PortfolioHoldingPerformance objects
-            company_sectors: Dict mapping symbol -> sector
 
         Returns:
             List of PortfolioSectorPerformanceRead with calculated metrics
@@ -451,7 +354,7 @@ class PortfolioService:
         # Group holdings by sector
         sector_holdings: dict[str, list] = {}
         for holding in holdings:
-            sector = company_sectors.get(holding.symbol, "")
+            sector = holding.sector
             if sector:  # Only include holdings with valid sectors
                 if sector not in sector_holdings:
                     sector_holdings[sector] = []
@@ -482,14 +385,13 @@ class PortfolioService:
         return sector_performances
 
     def _calculate_industry_performances(
-        self, holdings: list, company_industries: dict[str, str]
+        self, holdings: list
     ) -> list[PortfolioIndustryPerformanceRead]:
         """
         Calculate industry performance from holdings on-the-fly.
 
         Args:
             holdings: List of PortfolioHoldingPerformance objects
-            company_industries: Dict mapping symbol -> industry
 
         Returns:
             List of PortfolioIndustryPerformanceRead with calculated metrics
@@ -497,7 +399,7 @@ class PortfolioService:
         # Group holdings by industry
         industry_holdings: dict[str, list] = {}
         for holding in holdings:
-            industry = company_industries.get(holding.symbol, "")
+            industry = holding.industry
             if industry:  # Only include holdings with valid industries
                 if industry not in industry_holdings:
                     industry_holdings[industry] = []
@@ -2,27 +2,41 @@
 Pub/Sub message handler for processing incoming company batch sync messages.
 """
 
-import base64
+import asyncio
+import binascii
 import json
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from sqlalchemy.orm import Session
+
 from app.services.internal.company_sync_service import CompanySyncService
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent symbol syncs; keep below the engine's connection pool
+_MAX_SYNC_WORKERS = 8
+
 
 class PubSubHandler:
     """Handler for processing Pub/Sub company sync messages."""
 
-    def __init__(self, company_sync_service: CompanySyncService):
+    def __init__(
+        self,
+        company_sync_service_factory: Callable[[Session], CompanySyncService],
+        session_factory: Callable[[], Session],
+    ):
         """
         Initialize the Pub/Sub handler.
 
         Args:
-            company_sync_service: Service for syncing company data
+            company_sync_service_factory: Builds a CompanySyncService bound to a session
+            session_factory: Creates a database session for each synced symbol
         """
-        self.company_sync_service = company_sync_service
+        self.company_sync_service_factory = company_sync_service_factory
+        self.session_factory = session_factory
 
     def decode_pubsub_message(self, message: dict[str, Any]) -> dict[str, Any]:
         """
@@ -36,6 +50,7 @@ class PubSubHandler:
 
         Raises:
             ValueError: If the message format is invalid
+            TypeError: If the payload is not a JSON object
         """
         try:
             if "message" not in message:
@@ -45,9 +60,13 @@ class PubSubHandler:
             if "data" not in message_data:
                 raise ValueError("Invalid Pub/Sub message: missing 'data' field")
 
+            # json.loads accepts bytes directly, so skip the intermediate str.
+            # a2b_base64 is the C routine behind base64.b64decode without the
+            # Python-level argument normalisation wrapper.
             encoded_data = message_data.get("data")
-            decoded_data = base64.b64decode(encoded_data).decode("utf-8")
-            message_payload = json.loads(decoded_data)
+            message_payload = json.loads(binascii.a2b_base64(encoded_data))
+            if not isinstance(message_payload, dict):
+                raise TypeError("Invalid Pub/Sub message: payload must be an object")
 
             logger.info(
                 "Decoded Pub/Sub message",
@@ -58,7 +77,7 @@ class PubSubHandler:
             )
             return message_payload
 
-        except (ValueError, KeyError, json.JSONDecodeError) as e:
+        except (ValueError, TypeError, KeyError, json.JSONDecodeError) as e:
             logger.error(
                 f"Failed to decode Pub/Sub message: {str(e)}", extra={"error": str(e)}
             )
@@ -111,16 +130,29 @@ class PubSubHandler:
             success_count = 0
             failed_count = 0
 
-            for symbol in symbols:
-                try:
-                    self.company_sync_service.upsert_company(symbol)
+            # Symbols are independent, so sync them concurrently, each worker
+            # using its own session
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_SYNC_WORKERS, len(symbols))
+            ) as pool:
+                outcomes = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, self._sync_symbol, symbol)
+                        for symbol in symbols
+                    ),
+                    return_exceptions=True,
+                )
+
+            for symbol, outcome in zip(symbols, outcomes):
+                if isinstance(outcome, Exception):
+                    results[symbol] = f"error: {str(outcome)}"
+                    failed_count += 1
+                    logger.error(f"Failed to sync {symbol}: {str(outcome)}")
+                else:
                     results[symbol] = "success"
                     success_count += 1
                     logger.info(f"Successfully synced {symbol}")
-                except Exception as e:
-                    results[symbol] = f"error: {str(e)}"
-                    failed_count += 1
-                    logger.error(f"Failed to sync {symbol}: {str(e)}")
 
             return {
                 "status": "completed",
@@ -142,3 +174,16 @@ class PubSubHandler:
                 "action": "sync_company_batch",
                 "error": str(e),
             }
+
+    def _sync_symbol(self, symbol: str) -> None:
+        """
+        Sync a single company in its own database session.
+
+        Args:
+            symbol: Stock symbol to sync
+        """
+        session = self.session_factory()
+        try:
+            self.company_sync_service_factory(session).upsert_company(symbol)
+        finally:
+            session.close()
@@ -4,6 +4,7 @@ Pub/Sub service for publishing messages to Google Cloud Pub/Sub topics.
 
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Optional
 
 from google.api_core.exceptions import GoogleAPICallError
@@ -14,6 +15,18 @@ from app.core.config import config
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_publisher_client() -> pubsub_v1.PublisherClient:
+    """
+    Return the process-wide PublisherClient.
+
+    The client is thread-safe and owns the gRPC channel and batching threads,
+    so sharing it avoids re-negotiating the connection for every service
+    instance created per request.
+    """
+    return pubsub_v1.PublisherClient()
+
+
 class PubSubService:
     """Service for publishing company sync messages to Google Cloud Pub/Sub."""
 
@@ -23,19 +36,23 @@ class PubSubService:
 
         Args:
             project_id: Google Cloud project ID
-            credentials_path: Path to Google Cloud credentials JSON file (optional)
         """
         self.project_id = project_id
-        self.publisher_client = pubsub_v1.PublisherClient()
-        self._topics_cache: dict[str, str] = {}
+        self.publisher_client = get_publisher_client()
+        # Resolve the configured topics up front; others are resolved on demand
+        self._topics_cache: dict[str, str] = {
+            config.pubsub_company_sync_topic: self.publisher_client.topic_path(
+                project_id, config.pubsub_company_sync_topic
+            ),
+        }
 
     def _get_topic_path(self, topic_id: str) -> str:
         """Get the full topic path for a given topic ID."""
-        if topic_id not in self._topics_cache:
-            self._topics_cache[topic_id] = self.publisher_client.topic_path(
-                self.project_id, topic_id
-            )
-        return self._topics_cache[topic_id]
+        topic_path = self._topics_cache.get(topic_id)
+        if topic_path is None:
+            topic_path = self.publisher_client.topic_path(self.project_id, topic_id)
+            self._topics_cache[topic_id] = topic_path
+        return topic_path
 
     def publish_message(
         self,
@@ -1,10 +1,13 @@
+from collections import OrderedDict
+from datetime import datetime
 from logging import getLogger
+from operator import itemgetter
 
 from sqlalchemy.orm import Session
 
+from app.repositories.dto import WatchlistCompanyItemDTO
 from app.repositories.watchlist_repo import WatchlistRepository
 from app.schemas.user import (
-    WatchlistCompanyItem,
     WatchlistCreate,
     WatchlistItemCreate,
     WatchlistItemWrite,
@@ -14,6 +17,38 @@ from app.schemas.user import (
 )
 
 logger = getLogger(__name__)
+# Least recently used entries are dropped first once the cache is full
+local_items_cache: OrderedDict[int, dict] = OrderedDict()
+ITEMS_CACHE_MAX_ENTRIES = 1024
+ITEMS_CACHE_TIMEOUT_SECONDS = 60  # prices move underneath the items
+
+# Keys copied from the pre-loaded profile / ratio dicts onto WatchlistCompanyItemDTO
+_PROFILE_KEYS = ("company_name", "currency", "market_cap", "image")
+_RATIO_KEYS = (
+    "price_to_earnings_ratio",
+    "price_to_earnings_growth_ratio",
+    "forward_price_to_earnings_growth_ratio",
+    "price_to_book_ratio",
+    "price_to_sales_ratio",
+    "price_to_free_cash_flow_ratio",
+    "price_to_operating_cash_flow_ratio",
+)
+# Template for the copied fields; ratios stay None when none are loaded
+_FIELD_DEFAULTS = dict.fromkeys(_PROFILE_KEYS + _RATIO_KEYS)
+_profile_getter = itemgetter(*_PROFILE_KEYS)
+_ratio_getter = itemgetter(*_RATIO_KEYS)
+
+
+def _read_from_orm(watchlist) -> WatchlistRead:
+    """Build a WatchlistRead from a row or DTO already validated by the database."""
+    return WatchlistRead.model_construct(
+        id=watchlist.id,
+        name=watchlist.name,
+        currency=watchlist.currency,
+        description=watchlist.description,
+        created_at=watchlist.created_at,
+        updated_at=watchlist.updated_at,
+    )
 
 
 class WatchlistService:
@@ -23,13 +58,14 @@ class WatchlistService:
     def get_user_watchlists(self, user_id: int) -> list[WatchlistRead]:
         """Get all watchlists for a specific user."""
         watchlists = self._repository.get_all_watchlists(user_id)
-        return [WatchlistRead.model_validate(watchlist) for watchlist in watchlists]
+        return [_read_from_orm(watchlist) for watchlist in watchlists]
 
     def create_watchlist(
         self, watchlist_in: WatchlistUpsertRequest, user_id: int
     ) -> WatchlistRead:
         """Create a new watchlist for the authenticated user."""
-        watchlist_in = WatchlistCreate(
+        # The request body was validated at the API boundary
+        watchlist_in = WatchlistCreate.model_construct(
             name=watchlist_in.name,
             currency=watchlist_in.currency,
             description=watchlist_in.description,
@@ -37,39 +73,26 @@ class WatchlistService:
         )
         watchlist_dto = self._repository.create_watchlist(watchlist_in)
         logger.info(f"Created watchlist {watchlist_dto.id} for user {user_id}")
-        return WatchlistRead(
-            id=watchlist_dto.id,
-            name=watchlist_dto.name,
-            currency=watchlist_dto.currency,
-            description=watchlist_dto.description,
-            created_at=watchlist_dto.created_at,
-            updated_at=watchlist_dto.updated_at,
-        )
+        return _read_from_orm(watchlist_dto)
 
     def update_watchlist(
         self, watchlist_id, watchlist_in: WatchlistUpsertRequest, user_id: int
     ) -> WatchlistRead:
         """Update a watchlist for the authenticated user."""
-        if not self._repository.verify_watchlist_ownership(watchlist_id, user_id):
-            raise ValueError("Watchlist not found or access denied")
 
-        watchlist = WatchlistUpdate(
+        watchlist = WatchlistUpdate.model_construct(
             id=watchlist_id,
             name=watchlist_in.name,
             currency=watchlist_in.currency,
             description=watchlist_in.description,
             user_id=user_id,
         )
+        # The repository only updates a watchlist owned by this user
         watchlist_dto = self._repository.update_watchlist(watchlist, user_id)
+        if not watchlist_dto:
+            raise ValueError("Watchlist not found or access denied")
         logger.info(f"Updated watchlist {watchlist_dto.id} for user {user_id}")
-        return WatchlistRead(
-            id=watchlist_dto.id,
-            name=watchlist_dto.name,
-            currency=watchlist_dto.currency,
-            description=watchlist_dto.description,
-            created_at=watchlist_dto.created_at,
-            updated_at=watchlist_dto.updated_at,
-        )
+        return _read_from_orm(watchlist_dto)
 
     def delete_watchlist(self, watchlist_id: int, user_id: int) -> None:
         """Delete a watchlist, ensuring it belongs to the authenticated user."""
@@ -77,11 +100,12 @@ class WatchlistService:
             raise ValueError("Watchlist not found or access denied")
 
         self._repository.delete_watchlist(watchlist_id, user_id)
+        local_items_cache.pop(watchlist_id, None)
         logger.info(f"Deleted watchlist with ID: {watchlist_id}")
 
     def _convert_watchlist_item_to_company_item(
         self, item: any
-    ) -> WatchlistCompanyItem | None:
+    ) -> WatchlistCompanyItemDTO | None:
         """Convert a WatchlistItem to WatchlistCompanyItem with company details."""
         if not item or not item.company_profile:
             return None
@@ -89,89 +113,145 @@ class WatchlistService:
         # Safely extract financial ratio fields with None defaults
         financial_ratios = item.financial_ratios or {}
         company_profile = item.company_profile or {}
-        logger.info(f"Company profile for {item.symbol}: {company_profile}")
-        logger.info(f"Financial ratios for {item.symbol}: {financial_ratios}")
 
-        item_in = WatchlistCompanyItem(
+        # The repository builds both dicts with every key present
+        fields = _FIELD_DEFAULTS.copy()
+        fields.update(zip(_PROFILE_KEYS, _profile_getter(company_profile)))
+        if financial_ratios:
+            fields.update(zip(_RATIO_KEYS, _ratio_getter(financial_ratios)))
+
+        # Values come straight from the database; a plain dataclass is enough
+        # until the API layer serializes it against WatchlistCompanyItem
+        item_in = WatchlistCompanyItemDTO(
             id=item.id,
             symbol=item.symbol,
-            company_name=company_profile.get("company_name", None),
             price=item.current_price,
-            currency=company_profile.get("currency", None),
             price_change=item.price_change,
             price_change_percent=item.price_change_percent,
-            market_cap=company_profile.get("market_cap", None),
-            price_to_earnings_ratio=financial_ratios.get(
-                "price_to_earnings_ratio", None
-            ),
-            price_to_earnings_growth_ratio=financial_ratios.get(
-                "price_to_earnings_growth_ratio", None
-            ),
-            forward_price_to_earnings_growth_ratio=financial_ratios.get(
-                "forward_price_to_earnings_growth_ratio", None
-            ),
-            price_to_book_ratio=financial_ratios.get("price_to_book_ratio", None),
-            price_to_sales_ratio=financial_ratios.get("price_to_sales_ratio", None),
-            price_to_free_cash_flow_ratio=financial_ratios.get(
-                "price_to_free_cash_flow_ratio", None
-            ),
-            price_to_operating_cash_flow_ratio=financial_ratios.get(
-                "price_to_operating_cash_flow_ratio", None
-            ),
-            image=company_profile.get("image", None),
+            **fields,
         )
         return item_in
 
     def get_watchlist_items(
         self, watchlist_id: int, user_id: int
-    ) -> list[WatchlistCompanyItem]:
+    ) -> list[WatchlistCompanyItemDTO]:
         """Get all items for a watchlist, ensuring it belongs to the authenticated user."""
-        # Verify the user owns the watchlist
-        if not self._repository.verify_watchlist_ownership(watchlist_id, user_id):
+        # Verify the user owns the watchlist and read its change marker in one query
+        version = self._repository.get_watchlist_items_version(watchlist_id, user_id)
+        if version is None:
             raise ValueError("Watchlist not found or access denied")
 
+        cached = self._try_items_from_cache(watchlist_id, version)
+        if cached is not None:
+            return cached
+
         watchlist = self._repository.get_watchlist_with_relations(watchlist_id, user_id)
         if not watchlist:
             return []
 
-        result = []
-        watchlist_items = list(watchlist.items)
-        for item in watchlist_items:
-            if not item.company_profile:
-                continue
-            result.append(self._convert_watchlist_item_to_company_item(item))
+        result = [
+            self._convert_watchlist_item_to_company_item(item)
+            for item in watchlist.items
+            if item.company_profile
+        ]
+
+        self._store_items_in_cache(watchlist_id, version, result)
         return result
 
+    def _try_items_from_cache(
+        self, watchlist_id: int, version: int
+    ) -> list[WatchlistCompanyItemDTO] | None:
+        """Return cached items if the watchlist is unchanged and within timeout."""
+        entry = local_items_cache.get(watchlist_id)
+        if not entry:
+            return None
+        age = (datetime.now() - entry["timestamp"]).total_seconds()
+        if entry["version"] != version or age >= ITEMS_CACHE_TIMEOUT_SECONDS:
+            del local_items_cache[watchlist_id]
+            return None
+        local_items_cache.move_to_end(watchlist_id)
+        logger.debug("Returning cached items for watchlist %s", watchlist_id)
+        return entry["data"]
+
+    @staticmethod
+    def _store_items_in_cache(
+        watchlist_id: int, version: int, data: list[WatchlistCompanyItemDTO]
+    ) -> None:
+        """Cache built items, evicting the least recently used entry when full."""
+        local_items_cache[watchlist_id] = {
+            "version": version,
+            "data": data,
+            "timestamp": datetime.now(),
+        }
+        local_items_cache.move_to_end(watchlist_id)
+        while len(local_items_cache) > ITEMS_CACHE_MAX_ENTRIES:
+            local_items_cache.popitem(last=False)
+
     def add_watchlist_item(
         self, watchlist_id: int, watchlist_item_in: WatchlistItemWrite, user_id: int
-    ) -> WatchlistCompanyItem | None:
+    ) -> WatchlistCompanyItemDTO | None:
         """Add an item to a watchlist, ensuring it belongs to the authenticated user."""
-        if not self._repository.verify_watchlist_ownership(watchlist_id, user_id):
+        item_exists = self._repository.check_owned_watchlist_item_exists(
+            watchlist_id, user_id, watchlist_item_in.symbol
+        )
+        if item_exists is None:
             logger.error("Watchlist not found or access denied")
             raise ValueError("Watchlist not found or access denied")
 
-        if self._repository.check_watchlist_item_exists(
-            watchlist_id, watchlist_item_in.symbol
-        ):
+        if item_exists:
             logger.error("Watchlist item already exists")
             raise ValueError("Watchlist item already exists")
 
-        watchlist_item_in = WatchlistItemCreate(
+        watchlist_item_in = WatchlistItemCreate.model_construct(
             watchlist_id=watchlist_id,
             symbol=watchlist_item_in.symbol,
         )
         watchlist_item = self._repository.add_watchlist_item(watchlist_item_in)
+        local_items_cache.pop(watchlist_id, None)
         if watchlist_item:
-            # Load the item with all relations pre-loaded
-            result = self._repository.get_watchlist_item_with_relations(
-                watchlist_id, watchlist_item.id, user_id
-            )
+            # Ownership is already verified, attach company data to the new row
+            result = self._repository.attach_company_profile(watchlist_item)
             return self._convert_watchlist_item_to_company_item(result)
         return None
 
+    def bulk_add_watchlist_items(
+        self, watchlist_id: int, symbols: list[str], user_id: int
+    ) -> list[WatchlistCompanyItemDTO]:
+        """
+        Add several symbols to a watchlist owned by the authenticated user.
+
+        Symbols already in the watchlist (or repeated in the request) are
+        skipped rather than rejected, so the call can be retried safely.
+        """
+        if not self._repository.verify_watchlist_ownership(watchlist_id, user_id):
+            logger.error("Watchlist not found or access denied")
+            raise ValueError("Watchlist not found or access denied")
+
+        unique_symbols = list(dict.fromkeys(symbols))
+        if not unique_symbols:
+            return []
+
+        # One duplicate pre-check for the whole batch
+        existing = self._repository.get_existing_watchlist_symbols(
+            watchlist_id, unique_symbols
+        )
+        new_symbols = [symbol for symbol in unique_symbols if symbol not in existing]
+        if not new_symbols:
+            return []
+
+        items = self._repository.bulk_add_watchlist_items(watchlist_id, new_symbols)
+        local_items_cache.pop(watchlist_id, None)
+        self._repository.attach_company_profiles(items)
+        return [
+            self._convert_watchlist_item_to_company_item(item)
+            for item in items
+            if item.company_profile
+        ]
+
     def delete_watchlist_item(
         self, watchlist_id: int, watchlist_item_id: int, user_id: int
     ) -> None:
         """Delete a watchlist item, ensuring it belongs to the authenticated user's watchlist."""
         self._repository.delete_watchlist_item(watchlist_id, watchlist_item_id, user_id)
+        local_items_cache.pop(watchlist_id, None)
         logger.info(f"Deleted watchlist item with ID: {watchlist_item_id}")
@@ -2,18 +2,21 @@ import logging
 import sys
 from typing import Optional
 
+# Shared by every handler created here; formatters are stateless
+_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_CONFIGURED: set[str] = set()
+
 
 def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """Create a configured logger instance"""
     logger = logging.getLogger(name)
 
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    if name not in _CONFIGURED:
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(_FORMATTER)
+            logger.addHandler(handler)
+        _CONFIGURED.add(name)
 
     if level:
         logger.setLevel(level)
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import TypeVar
 
 from pydantic import BaseModel
@@ -6,7 +7,16 @@ from sqlalchemy.orm import DeclarativeBase
 T = TypeVar("T", bound=DeclarativeBase)
 
 
-def map_model(target: T, source: BaseModel, exclude_unset: bool = True) -> T:
+@cache
+def _mapped_fields(model_class: type) -> frozenset[str]:
+    """Return the mapped attribute names of a SQLAlchemy model class."""
+    mapper = getattr(model_class, "__mapper__", None)
+    if mapper is None:
+        raise TypeError("Target must be a SQLAlchemy model instance")
+    return frozenset(attr.key for attr in mapper.attrs)
+
+
+def map_model(target: T, source: BaseModel) -> T:
     """
     Maps fields from a Pydantic model to a SQLAlchemy model instance.
     Only maps fields that exist on the target model.
@@ -17,14 +27,16 @@ def map_model(target: T, source: BaseModel, exclude_unset: bool = True) -> T:
 
     Returns:
         Updated SQLAlchemy model instance
-    """
-    if not isinstance(target, DeclarativeBase):
-        raise TypeError("Target must be a SQLAlchemy model instance")
 
-    source_dict = source.model_dump()
+    Raises:
+        TypeError: If target is not a mapped SQLAlchemy model instance
+    """
+    # Unmapped targets are rejected once per class inside _mapped_fields
+    allowed = _mapped_fields(type(target))
+    # Only serialize the fields the target can take, as plain Python values
+    source_dict = source.model_dump(mode="python", include=allowed)
 
     for field, value in source_dict.items():
-        if hasattr(target, field):
-            setattr(target, field, value)
+        setattr(target, field, value)
 
     return target
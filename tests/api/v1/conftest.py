@@ -0,0 +1,30 @@
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from app.api.v1.company import get_company_profile
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def app_nomodel():
+    """Sibling app serving plumbing-only routes with response_model=None.
+
+    It shares app.dependency_overrides, so overrides installed by tests apply to
+    both apps.
+    """
+    nomodel = FastAPI()
+    nomodel.dependency_overrides = app.dependency_overrides
+    nomodel.add_api_route(
+        "/api/v1/company/{symbol}",
+        get_company_profile,
+        methods=["GET"],
+        response_model=None,
+    )
+    return nomodel
+
+
+@pytest.fixture(scope="session")
+def client_nomodel(app_nomodel):
+    """TestClient for tests that only check the endpoint surfaces the mock."""
+    return TestClient(app_nomodel)
@@ -1,54 +1,100 @@
-from unittest.mock import Mock
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
 
-from app.api.v1.company import get_company_service
+from app.api.v1.company import get_company_profile, get_company_service
 from app.main import app
 from app.services.company_service import CompanyService
 from tests.common.mock_company_data import MockCompanyDataBuilder
 from tests.common.mock_company_grading_data import MockCompanyGradingDataBuilder
 from tests.common.mock_company_page_data import MockCompanyPageDataBuilder
 
+REQUIRED_KEYS = frozenset(
+    {
+        "company",
+        "ratios",
+        "grading_summary",
+        "stock_prices",
+        "latest_gradings",
+        "stock_news",
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def _company_service_mock_proto():
+    """Provide the autospec'd CompanyService mock shared across the session."""
+    return create_autospec(CompanyService, instance=True)
+
+
+@pytest.fixture(scope="module")
+def aapl_company_read():
+    """Build the AAPL CompanyRead once; read models are safe to share."""
+    return MockCompanyDataBuilder.company_read(symbol="AAPL", company_name="Apple Inc.")
+
+
+@pytest.fixture(scope="module")
+def sample_company_read():
+    """Build the TEST CompanyRead once per module."""
+    return MockCompanyDataBuilder.company_read(symbol="TEST")
+
+
+@pytest.fixture(scope="module")
+def sample_grading_summary_read():
+    """Build the TEST grading summary once per module."""
+    return MockCompanyGradingDataBuilder.company_grading_summary_read(symbol="TEST")
+
 
 class TestCompanyAPI:
     """Comprehensive test suite for Company API endpoints."""
 
     @pytest.fixture
     def mock_session(self):
-        """Create a mock database session."""
-        return Mock(spec=Session)
+        """Create a mock database session.
 
-    @pytest.fixture
-    def mock_company_service(self):
-        """Create a mock CompanyPageService."""
-        return Mock(spec=CompanyService)
+        The session is only stored on the service, so a plain MagicMock is
+        enough and avoids speccing SQLAlchemy's large Session surface.
+        """
+        return MagicMock()
+
+    @pytest.fixture(autouse=True)
+    def mock_company_service(self, _company_service_mock_proto):
+        """Provide the shared mock CompanyService, reset for this test."""
+        # copy.copy would share child mocks (and their return values) between
+        # tests, so reuse the prototype and reset it instead
+        _company_service_mock_proto.reset_mock(return_value=True, side_effect=True)
+        return _company_service_mock_proto
 
     def test_get_company_service_creation(self, mock_session):
+        """Test that the dependency builds a CompanyService on the session."""
         # Arrange & Act
-        service = get_company_service(session=mock_session)
+        service = get_company_service(
+            fmp_client=MagicMock(),
+            yfinance_client=MagicMock(),
+            db_session=mock_session,
+        )
 
         # Assert
         assert isinstance(service, CompanyService)
         assert service._db == mock_session
 
-    @pytest.fixture(autouse=True)
-    def setup_dependency_override(self, mock_company_service):
-        """Override the company service dependency for testing."""
-        app.dependency_overrides[get_company_service] = lambda: mock_company_service
+    @pytest.fixture(scope="module", autouse=True)
+    def setup_dependency_override(self, _company_service_mock_proto):
+        """Override the company service dependency once for the module."""
+        app.dependency_overrides[get_company_service] = lambda: (
+            _company_service_mock_proto
+        )
         yield
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_company_service, None)
 
     def test_get_company_profile_success_complete_data(
-        self, client, mock_company_service
+        self, client, mock_company_service, aapl_company_read
     ):
         """Test successful company profile retrieval with complete data."""
         # Arrange
-        company_read = MockCompanyDataBuilder.company_read(
-            symbol="AAPL", company_name="Apple Inc."
-        )
         mock_page_response = MockCompanyPageDataBuilder.company_page_response(
-            company=company_read
+            company=aapl_company_read
         )
         mock_company_service.get_company_page.return_value = mock_page_response
 
@@ -58,7 +104,6 @@ class TestCompanyAPI:
         # Assert
         assert response.status_code == 200
         data = response.json()
-        print(data)
 
         # Verify company data
         assert data["company"]["symbol"] == "AAPL"
@@ -66,53 +111,73 @@ class TestCompanyAPI:
 
         mock_company_service.get_company_page.assert_called_once_with("AAPL")
 
-    def test_get_company_profile_not_found(self, client, mock_company_service):
-        """Test company profile not found scenario."""
+    def test_get_company_profile_surfaces_service_page(
+        self, client_nomodel, mock_company_service
+    ):
+        """Test that the handler returns the service's page verbatim.
+
+        Plumbing only: client_nomodel skips response_model validation, so the
+        production route is covered by the success test above.
+        """
         # Arrange
-        mock_company_service.get_company_page.return_value = None
+        mock_page_response = MockCompanyPageDataBuilder.company_page_response()
+        mock_company_service.get_company_page.return_value = mock_page_response
 
         # Act
-        response = client.get("/api/v1/company/INVALID")
+        response = client_nomodel.get("/api/v1/company/TEST")
 
         # Assert
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Company not found"
-        mock_company_service.get_company_page.assert_called_once_with("INVALID")
+        assert response.status_code == 200
+        assert response.json() == mock_page_response.model_dump(mode="json")
+        mock_company_service.get_company_page.assert_called_once_with("TEST")
 
-    @pytest.mark.parametrize(
-        "symbol", ["AAPL", "GOOGL", "MSFT", "TSLA", "BRK.A", "BRK-B"]
-    )
-    def test_get_company_profile_various_valid_symbols(
-        self, client, mock_company_service, symbol
-    ):
-        """Test API with various valid symbol formats."""
+    def test_get_company_profile_not_found(self, mock_company_service):
+        """Test company profile not found scenario."""
         # Arrange
         mock_company_service.get_company_page.return_value = None
 
         # Act
-        response = client.get(f"/api/v1/company/{symbol}")
+        with pytest.raises(HTTPException) as exc_info:
+            get_company_profile(symbol="INVALID", service=mock_company_service)
 
         # Assert
-        assert response.status_code == 404  # Since we return None
-        mock_company_service.get_company_page.assert_called_once_with(symbol)
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Company not found"
+        mock_company_service.get_company_page.assert_called_once_with("INVALID")
+
+    def test_get_company_profile_various_valid_symbols(self, mock_company_service):
+        """Test API with various valid symbol formats."""
+        for symbol in ["AAPL", "GOOGL", "MSFT", "TSLA", "BRK.A", "BRK-B"]:
+            # Arrange
+            mock_company_service.reset_mock(return_value=True)
+            mock_company_service.get_company_page.return_value = None
+
+            # Act
+            with pytest.raises(HTTPException) as exc_info:
+                get_company_profile(symbol=symbol, service=mock_company_service)
+
+            # Assert
+            assert exc_info.value.status_code == 404  # Since we return None
+            mock_company_service.get_company_page.assert_called_once_with(symbol)
 
     @pytest.mark.parametrize("invalid_symbol", ["!@$", "123456789012345678901"])
     def test_get_company_profile_invalid_symbols(
-        self, client, mock_company_service, invalid_symbol
+        self, mock_company_service, invalid_symbol
     ):
         """Test API with invalid symbol formats."""
         # Arrange
         mock_company_service.get_company_page.return_value = None
 
         # Act
-        response = client.get(f"/api/v1/company/{invalid_symbol}")
+        with pytest.raises(HTTPException) as exc_info:
+            get_company_profile(symbol=invalid_symbol, service=mock_company_service)
 
         # Assert
         # The API should still process these, but service returns None
-        assert response.status_code == 404
+        assert exc_info.value.status_code == 404
         mock_company_service.get_company_page.assert_called_once_with(invalid_symbol)
 
-    def test_get_company_profile_service_exception(self, client, mock_company_service):
+    def test_get_company_profile_service_exception(self, mock_company_service):
         """Test API behavior when service raises an exception."""
         # Arrange
         mock_company_service.get_company_page.side_effect = Exception(
@@ -121,11 +186,9 @@ class TestCompanyAPI:
 
         # Act & Assert
         with pytest.raises(Exception, match="Database connection error"):
-            _ = client.get("/api/v1/company/AAPL")
+            get_company_profile(symbol="AAPL", service=mock_company_service)
 
-    def test_get_company_profile_service_validation_error(
-        self, client, mock_company_service
-    ):
+    def test_get_company_profile_service_validation_error(self, mock_company_service):
         """Test API behavior when service has validation errors."""
         # Arrange
         mock_company_service.get_company_page.side_effect = ValueError(
@@ -134,39 +197,33 @@ class TestCompanyAPI:
 
         # Act & Assert
         with pytest.raises(ValueError, match="Invalid data format"):
-            _ = client.get("/api/v1/company/AAPL")
-
-    def test_dependency_injection(self, mock_session):
-        """Test that the dependency injection works correctly."""
-        # Act
-        service = get_company_service(session=mock_session)
-
-        # Assert
-        assert isinstance(service, CompanyService)
-        assert service._db == mock_session
+            get_company_profile(symbol="AAPL", service=mock_company_service)
 
     def test_router_configuration(self):
         """Test that the router is configured correctly."""
         from app.api.v1.company import router
 
         # Assert
-        assert router.prefix == "/company"
+        assert router.prefix == ""
 
-        # Check that the route exists
+        # Check that the route exists; app.main mounts it under /api/v1/company
         routes = [route.path for route in router.routes]
-        assert "/company/{symbol}" in routes
-
-    def test_response_model_validation(self, client, mock_company_service):
+        assert "/{symbol}" in routes
+
+    def test_response_model_validation(
+        self,
+        client,
+        mock_company_service,
+        sample_company_read,
+        sample_grading_summary_read,
+    ):
         """Test that response follows the CompanyPageResponse model."""
         # Arrange
         valid_response = MockCompanyPageDataBuilder.company_page_response(
-            company=MockCompanyDataBuilder.company_read(symbol="TEST"),
-            grading_summary=MockCompanyGradingDataBuilder.company_grading_summary_read(
-                symbol="TEST"
-            ),
-            general_news=[],
-            price_target_news=[],
-            grading_news=[],
+            company=sample_company_read,
+            grading_summary=sample_grading_summary_read,
+            latest_gradings=[],
+            stock_news=[],
         )
         mock_company_service.get_company_page.return_value = valid_response
 
@@ -178,30 +235,24 @@ class TestCompanyAPI:
         data = response.json()
 
         # Verify response structure matches CompanyPageResponse
-        required_keys = [
-            "company",
-            "grading_summary",
-            "general_news",
-            "price_target_news",
-            "grading_news",
-        ]
-        assert all(key in data for key in required_keys)
-
-    def test_http_methods(self, client, mock_company_service):
+        assert not REQUIRED_KEYS - data.keys()
+
+    @pytest.mark.parametrize(
+        "method,expected_codes",
+        [
+            ("get", {200, 404}),  # Allowed method
+            ("post", {405}),  # Method Not Allowed
+            ("put", {405}),
+            ("delete", {405}),
+        ],
+    )
+    def test_http_methods(self, client, mock_company_service, method, expected_codes):
         """Test that only GET method is allowed."""
         # Arrange
         mock_company_service.get_company_page.return_value = None
 
-        # Test allowed method
-        get_response = client.get("/api/v1/company/AAPL")
-        assert get_response.status_code in [200, 404]  # Valid response codes
-
-        # Test disallowed methods
-        post_response = client.post("/api/v1/company/AAPL")
-        assert post_response.status_code == 405  # Method Not Allowed
-
-        put_response = client.put("/api/v1/company/AAPL")
-        assert put_response.status_code == 405  # Method Not Allowed
+        # Act
+        response = getattr(client, method)("/api/v1/company/AAPL")
 
-        delete_response = client.delete("/api/v1/company/AAPL")
-        assert delete_response.status_code == 405  # Method Not Allowed
+        # Assert
+        assert response.status_code in expected_codes
@@ -0,0 +1,76 @@
+from unittest.mock import create_autospec
+
+import pytest
+from fastapi import status
+
+from app.api.v1.watchlist import get_watchlist_service
+from app.dependencies.auth import get_current_user
+from app.main import app
+from app.repositories.dto import WatchlistCompanyItemDTO
+from app.schemas.user import UserRead, WatchlistCompanyItem
+from app.services.watchlist_service import WatchlistService
+
+ACCESS_DENIED = "Watchlist not found or access denied"
+
+
+class TestWatchlistItemsAPI:
+    """Test suite for the watchlist item endpoints."""
+
+    @pytest.fixture
+    def mock_watchlist_service(self):
+        """Override the watchlist service and authenticated user for one test."""
+        service = create_autospec(WatchlistService, instance=True)
+        app.dependency_overrides[get_watchlist_service] = lambda: service
+        app.dependency_overrides[get_current_user] = lambda: UserRead(
+            id=2, username="other", email="other@example.com"
+        )
+        yield service
+        app.dependency_overrides.clear()
+
+    def test_bulk_add_access_denied_matches_single_add(
+        self, client, mock_watchlist_service
+    ):
+        """Test that single and bulk add map access denied to the same status."""
+        # Arrange
+        mock_watchlist_service.add_watchlist_item.side_effect = ValueError(
+            ACCESS_DENIED
+        )
+        mock_watchlist_service.bulk_add_watchlist_items.side_effect = ValueError(
+            ACCESS_DENIED
+        )
+
+        # Act
+        single = client.post("/api/v1/watchlist/1/items", json={"symbol": "AAPL"})
+        bulk = client.post("/api/v1/watchlist/1/items/bulk", json=[{"symbol": "AAPL"}])
+
+        # Assert
+        assert single.status_code == status.HTTP_404_NOT_FOUND
+        assert bulk.status_code == single.status_code
+        assert bulk.json() == single.json() == {"detail": ACCESS_DENIED}
+
+    def test_get_watchlist_items_matches_response_schema(
+        self, client, mock_watchlist_service
+    ):
+        """Test that items without a price serialize to the advertised schema."""
+        # Arrange
+        mock_watchlist_service.get_watchlist_items.return_value = [
+            WatchlistCompanyItemDTO(
+                id=1,
+                symbol="AAPL",
+                company_name="Apple Inc.",
+                price=None,
+                currency="USD",
+                price_change=None,
+                price_change_percent=None,
+                market_cap=3_000_000_000_000.0,
+            )
+        ]
+
+        # Act
+        response = client.get("/api/v1/watchlist/1")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        items = [WatchlistCompanyItem.model_validate(i) for i in response.json()]
+        assert items[0].price is None
+        assert items[0].price_change is None
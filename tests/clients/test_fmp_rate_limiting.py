@@ -0,0 +1,23 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.clients.fmp.fmp_client import FMPClient, FMPConfig
+
+
+class TestFMPClientRateLimiting:
+    """Test suite for FMPClient request spacing."""
+
+    def test_concurrent_requests_respect_rate_limit_delay(self):
+        """Test that threads sharing a client are spaced by rate_limit_delay."""
+        # Arrange
+        delay = 0.05
+        client = FMPClient("k", FMPConfig(api_key="k", rate_limit_delay=delay))
+        client._apply_rate_limiting()
+        start = time.time()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: client._apply_rate_limiting(), range(4)))
+
+        # Assert
+        assert time.time() - start >= 4 * delay * 0.9
@@ -0,0 +1,105 @@
+from types import MappingProxyType
+from typing import Type, TypeVar, Any, Dict, Iterable, Mapping
+
+from pydantic import BaseModel
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+S = TypeVar("S", bound=BaseModel)
+
+# Columns the database assigns; never sent with an INSERT
+DB_MANAGED_FIELDS = frozenset({"id", "created_at", "updated_at"})
+
+
+def db_defaults(defaults: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Return builder defaults without DB-managed fields, for save_one/save_many.
+
+    Args:
+        defaults: Default values for the model, including id and timestamps
+
+    Returns:
+        Read-only copy of defaults without DB_MANAGED_FIELDS
+    """
+    return MappingProxyType(
+        {k: v for k, v in defaults.items() if k not in DB_MANAGED_FIELDS}
+    )
+
+
+def build_schema(prototype: S, overrides: Dict[str, Any]) -> S:
+    """
+    Build a Pydantic schema from a prototype validated once from its defaults.
+
+    Without overrides this returns a copy of the prototype. With overrides the
+    schema is built with model_construct from the prototype's values, so
+    overrides must already have their schema types; builders that exercise the
+    validators construct the schema class directly.
+
+    Args:
+        prototype: Schema instance validated from defaults
+        overrides: Values to override defaults
+
+    Returns:
+        Schema instance with merged data, never the prototype itself
+    """
+    if not overrides:
+        return prototype.model_copy()
+    return type(prototype).model_construct(**(dict(prototype) | overrides))
+
+
+def save_one(
+    db_session: Session,
+    model_class: Type[T],
+    defaults: Mapping[str, Any],
+    overrides: Dict[str, Any],
+) -> T:
+    """
+    Save a single model to database.
+
+    Args:
+        db_session: Database session
+        model_class: The SQLAlchemy model class to insert
+        defaults: Default values for the model, without DB-managed fields
+        overrides: Values to override defaults
+
+    Returns:
+        Saved model instance, populated from INSERT ... RETURNING
+    """
+    return save_many(db_session, model_class, defaults, [overrides])[0]
+
+
+def save_many(
+    db_session: Session,
+    model_class: Type[T],
+    defaults: Mapping[str, Any],
+    overrides_list: Iterable[Dict[str, Any]],
+) -> list[T]:
+    """
+    Save several models with one INSERT ... RETURNING and a single commit.
+
+    Args:
+        db_session: Database session
+        model_class: The SQLAlchemy model class to insert
+        defaults: Default values for every row, without DB-managed fields
+        overrides_list: One dict of overrides per row
+
+    Returns:
+        Saved model instances, in the order of overrides_list
+    """
+    rows = []
+    for overrides in overrides_list:
+        data = defaults | overrides
+        # Only overrides can reintroduce fields that shouldn't be set
+        for key in DB_MANAGED_FIELDS.intersection(overrides):
+            del data[key]
+        rows.append(data)
+    if not rows:
+        return []
+
+    models = db_session.scalars(
+        insert(model_class).returning(model_class, sort_by_parameter_order=True),
+        rows,
+    ).all()
+    db_session.commit()
+    return list(models)
@@ -1,48 +1,74 @@
-from typing import Type, TypeVar, Any, Dict
-from unittest.mock import Mock, PropertyMock
-from sqlalchemy.orm import Session
+from datetime import date, datetime, timezone
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Type, TypeVar, Any, Dict, Iterable, Mapping
+from unittest.mock import Mock
 
 from app.db.models.company import Company
 from app.schemas.company import CompanyRead, CompanyWrite
+from tests.common._persistence import build_schema, save_many, save_one
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
 
 T = TypeVar("T")
 
+# Attribute names Mock(spec=Company) would otherwise rebuild via dir(Company)
+# for every mock; a sequence spec is used as-is. The helper methods set by
+# company_mock are not on Company, so spec_set needs them listed too
+_COMPANY_SPEC_ATTRS = tuple(dir(Company)) + ("to_dict", "refresh_from_db")
+
+
+def _refresh_from_db_noop() -> None:
+    """Shared no-op for mock_company.refresh_from_db."""
+
 
 class MockCompanyDataBuilder:
     """Builder for creating test data for company with minimal duplication."""
 
     # Define default data
-    _COMPANY_DEFAULTS = {
-        "symbol": "TEST",
-        "company_name": "Test Company Inc.",
-        "price": 100.0,
-        "market_cap": 1000000000,
-        "currency": "USD",
-        "exchange_full_name": "Test Exchange",
-        "exchange": "TEST",
-        "industry": "Technology",
-        "website": "https://test.com",
-        "description": "A test company for unit testing.",
-        "sector": "Technology",
-        "country": "United States",
-        "phone": "1-800-TEST",
-        "address": "123 Test St",
-        "city": "Test City",
-        "state": "Test State",
-        "zip": "12345",
-        "image": "https://test.com/logo.png",
-        "ipo_date": "2020-01-01",
-    }
-
-    _COMPANY_READ_EXTRA = {
-        "id": 1,
-        "created_at": "2023-10-01T00:00:00Z",
-        "updated_at": "2023-10-01T00:00:00Z",
-    }
+    _COMPANY_DEFAULTS = MappingProxyType(
+        {
+            "symbol": "TEST",
+            "company_name": "Test Company Inc.",
+            "price": 100.0,
+            "market_cap": 1000000000,
+            "currency": "USD",
+            "exchange_full_name": "Test Exchange",
+            "exchange": "TEST",
+            "industry": "Technology",
+            "website": "https://test.com",
+            "description": "A test company for unit testing.",
+            "sector": "Technology",
+            "country": "United States",
+            "phone": "1-800-TEST",
+            "address": "123 Test St",
+            "city": "Test City",
+            "state": "Test State",
+            "zip": "12345",
+            "image": "https://test.com/logo.png",
+            "ipo_date": date(2020, 1, 1),
+        }
+    )
+
+    _COMPANY_READ_EXTRA = MappingProxyType(
+        {
+            "id": 1,
+            "created_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+        }
+    )
+
+    # Merged once at class creation; builders only layer overrides on top
+    _COMPANY_READ_DEFAULTS = MappingProxyType(
+        {**_COMPANY_DEFAULTS, **_COMPANY_READ_EXTRA}
+    )
+
+    _COMPANY_WRITE_PROTOTYPE = CompanyWrite(**_COMPANY_DEFAULTS)
+    _COMPANY_READ_PROTOTYPE = CompanyRead(**_COMPANY_READ_DEFAULTS)
 
     @staticmethod
     def _create_model(
-        model_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
+        model_class: Type[T], defaults: Mapping[str, Any], overrides: Dict[str, Any]
     ) -> T:
         """
         Generic method to create a model instance.
@@ -55,86 +81,13 @@ class MockCompanyDataBuilder:
         Returns:
             Model instance with merged data
         """
-        data = {**defaults, **overrides}
+        data = defaults | overrides
         model = model_class(**data)
         # Manually set id since it's usually auto-generated
         if "id" in data:
             model.id = data["id"]
         return model
 
-    @staticmethod
-    def _create_schema(
-        schema_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
-    ) -> T:
-        """
-        Generic method to create a Pydantic schema instance.
-
-        Args:
-            schema_class: The Pydantic schema class to instantiate
-            defaults: Default values for the schema
-            overrides: Values to override defaults
-
-        Returns:
-            Schema instance with merged data
-        """
-        return schema_class(**(defaults | overrides))
-
-    @staticmethod
-    def _save_to_db(
-        db_session: Session,
-        model_class: Type[T],
-        defaults: Dict[str, Any],
-        overrides: Dict[str, Any],
-    ) -> T:
-        """
-        Generic method to save a model to database.
-
-        Args:
-            db_session: Database session
-            model_class: The SQLAlchemy model class to instantiate
-            defaults: Default values for the model
-            overrides: Values to override defaults
-
-        Returns:
-            Saved and refreshed model instance
-        """
-        # Remove fields that shouldn't be set when creating
-        data = {**defaults, **overrides}
-        data.pop("id", None)
-        data.pop("created_at", None)
-        data.pop("updated_at", None)
-
-        model = model_class(**data)
-        db_session.add(model)
-        db_session.commit()
-        db_session.refresh(model)
-        return model
-
-    @staticmethod
-    def _create_mock(defaults: Dict[str, Any], overrides: Dict[str, Any]) -> Mock:
-        """
-        Create a mock Company object with PropertyMock attributes.
-
-        Args:
-            defaults: Default values for the mock
-            overrides: Values to override defaults
-
-        Returns:
-            Mock company object with configured attributes
-        """
-        data = {**defaults, **overrides}
-        mock_company = Mock(spec=Company)
-
-        # Set attributes using PropertyMock for proper attribute access
-        for key, value in data.items():
-            setattr(type(mock_company), key, PropertyMock(return_value=value))
-
-        # Add common mock methods
-        mock_company.to_dict = Mock(return_value=data)
-        mock_company.refresh_from_db = Mock(return_value=None)
-
-        return mock_company
-
     # ===== Company Mock (for unit tests) =====
     @staticmethod
     def company_mock(**overrides) -> Mock:
@@ -155,11 +108,22 @@ class MockCompanyDataBuilder:
             >>> mock.grading_summary = Mock()  # Can freely set relationships
             >>> assert mock.symbol == "AAPL"
         """
-        defaults = {
-            **MockCompanyDataBuilder._COMPANY_DEFAULTS,
-            **MockCompanyDataBuilder._COMPANY_READ_EXTRA,
-        }
-        return MockCompanyDataBuilder._create_mock(defaults, overrides)
+        # Built inline rather than through a generic helper: this is the
+        # hottest builder in the repository unit tests. A name-list spec skips
+        # signature introspection; spec rather than spec_set so callers can
+        # still attach extra relationships
+        data = MockCompanyDataBuilder._COMPANY_READ_DEFAULTS | overrides
+        mock_company = Mock(spec=_COMPANY_SPEC_ATTRS)
+
+        # Instance attributes rather than PropertyMocks on type(mock), which
+        # would leak between mocks sharing the same spec class. The helper
+        # methods are plain callables since no test asserts on them
+        mock_company.configure_mock(
+            **data,
+            to_dict=lambda: data,
+            refresh_from_db=_refresh_from_db_noop,
+        )
+        return mock_company
 
     # ===== Company Model (SQLAlchemy) =====
     @staticmethod
@@ -202,10 +166,26 @@ class MockCompanyDataBuilder:
             >>> write_schema = MockCompanyDataBuilder.company_write(symbol="AAPL")
             >>> assert isinstance(write_schema, CompanyWrite)
         """
-        return MockCompanyDataBuilder._create_schema(
-            CompanyWrite, MockCompanyDataBuilder._COMPANY_DEFAULTS, overrides
+        return build_schema(
+            MockCompanyDataBuilder._COMPANY_WRITE_PROTOTYPE,
+            overrides,
         )
 
+    @staticmethod
+    def company_write_validated(**overrides) -> CompanyWrite:
+        """
+        Create a CompanyWrite schema instance through Pydantic validation.
+
+        Use for tests that exercise schema validators (e.g. URL coercion).
+
+        Args:
+            **overrides: Override default values for any company attributes
+
+        Returns:
+            CompanyWrite: Validated Pydantic schema for API input
+        """
+        return CompanyWrite(**(MockCompanyDataBuilder._COMPANY_DEFAULTS | overrides))
+
     # ===== Company Read Schema (Pydantic) =====
     @staticmethod
     def company_read(**overrides) -> CompanyRead:
@@ -225,15 +205,14 @@ class MockCompanyDataBuilder:
             >>> assert isinstance(read_schema, CompanyRead)
             >>> assert hasattr(read_schema, 'id')
         """
-        defaults = {
-            **MockCompanyDataBuilder._COMPANY_DEFAULTS,
-            **MockCompanyDataBuilder._COMPANY_READ_EXTRA,
-        }
-        return MockCompanyDataBuilder._create_schema(CompanyRead, defaults, overrides)
+        return build_schema(
+            MockCompanyDataBuilder._COMPANY_READ_PROTOTYPE,
+            overrides,
+        )
 
     # ===== Save to Database (for integration tests) =====
     @staticmethod
-    def save_company(db_session: Session, **overrides) -> Company:
+    def save_company(db_session: "Session", **overrides) -> Company:
         """
         Save Company to database.
 
@@ -244,12 +223,41 @@ class MockCompanyDataBuilder:
             **overrides: Override default values for any company attributes
 
         Returns:
-            Company: Saved and refreshed SQLAlchemy model
+            Company: Saved SQLAlchemy model
 
         Examples:
             >>> company = MockCompanyDataBuilder.save_company(db_session, symbol="AAPL")
             >>> assert company.id is not None  # ID assigned by database
         """
-        return MockCompanyDataBuilder._save_to_db(
+        return save_one(
             db_session, Company, MockCompanyDataBuilder._COMPANY_DEFAULTS, overrides
         )
+
+    @staticmethod
+    def save_many_companies(
+        db_session: "Session", overrides_list: Iterable[Dict[str, Any]]
+    ) -> list[Company]:
+        """
+        Save several Company rows to database with one bulk INSERT.
+
+        Use instead of calling the single-row helper in a loop when seeding
+        many companies.
+
+        Args:
+            db_session: SQLAlchemy database session
+            overrides_list: One dict of overrides per row to insert
+
+        Returns:
+            list[Company]: Saved SQLAlchemy models, in input order
+
+        Examples:
+            >>> rows = MockCompanyDataBuilder.save_many_companies(
+            ...     db_session, [{"symbol": "AAPL"}, {"symbol": "MSFT"}]
+            ... )
+        """
+        return save_many(
+            db_session,
+            Company,
+            MockCompanyDataBuilder._COMPANY_DEFAULTS,
+            overrides_list,
+        )
@@ -1,8 +1,12 @@
-from typing import Type, TypeVar, Any, Dict
+from datetime import date, datetime, timezone
+from types import MappingProxyType
+from typing import Type, TypeVar, Any, Dict, Iterable, Mapping
+
 from sqlalchemy.orm import Session
 
 from app.schemas.market_data import CompanyGradingRead, CompanyGradingSummaryRead
 from app.db.models.grading import CompanyGrading, CompanyGradingSummary
+from tests.common._persistence import build_schema, db_defaults, save_many, save_one
 
 T = TypeVar("T")
 
@@ -11,35 +15,47 @@ class MockCompanyGradingDataBuilder:
     """Builder for creating test data for company grading with minimal duplication."""
 
     # Define default data for each type
-    _GRADING_DEFAULTS = {
-        "id": 1,
-        "company_id": 1,
-        "symbol": "TEST",
-        "grade": "A",
-        "score": 85.5,
-        "recommendation": "BUY",
-        "date": "2023-10-01",
-        "created_at": "2023-10-01T00:00:00Z",
-        "updated_at": "2023-10-01T00:00:00Z",
-    }
-
-    _GRADING_SUMMARY_DEFAULTS = {
-        "id": 1,
-        "company_id": 1,
-        "symbol": "TEST",
-        "strong_buy": 5,
-        "buy": 3,
-        "hold": 1,
-        "sell": 0,
-        "strong_sell": 0,
-        "consensus": "Strong Buy",
-        "created_at": "2023-10-01T00:00:00Z",
-        "updated_at": "2023-10-01T00:00:00Z",
-    }
+    _GRADING_DEFAULTS = MappingProxyType(
+        {
+            "id": 1,
+            "company_id": 1,
+            "symbol": "TEST",
+            "grade": "A",
+            "score": 85.5,
+            "recommendation": "BUY",
+            "date": date(2023, 10, 1),
+            "created_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+        }
+    )
+
+    _GRADING_SUMMARY_DEFAULTS = MappingProxyType(
+        {
+            "id": 1,
+            "company_id": 1,
+            "symbol": "TEST",
+            "strong_buy": 5,
+            "buy": 3,
+            "hold": 1,
+            "sell": 0,
+            "strong_sell": 0,
+            "consensus": "Strong Buy",
+            "created_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+        }
+    )
+
+    _GRADING_DB_DEFAULTS = db_defaults(_GRADING_DEFAULTS)
+    _GRADING_SUMMARY_DB_DEFAULTS = db_defaults(_GRADING_SUMMARY_DEFAULTS)
+
+    _GRADING_READ_PROTOTYPE = CompanyGradingRead(**_GRADING_DEFAULTS)
+    _GRADING_SUMMARY_READ_PROTOTYPE = CompanyGradingSummaryRead(
+        **_GRADING_SUMMARY_DEFAULTS
+    )
 
     @staticmethod
     def _create_model(
-        model_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
+        model_class: Type[T], defaults: Mapping[str, Any], overrides: Dict[str, Any]
     ) -> T:
         """
         Generic method to create a model instance.
@@ -52,61 +68,13 @@ class MockCompanyGradingDataBuilder:
         Returns:
             Model instance with merged data
         """
-        data = {**defaults, **overrides}
+        data = defaults | overrides
         model = model_class(**data)
         # Manually set id since it's usually auto-generated
         if "id" in data:
             model.id = data["id"]
         return model
 
-    @staticmethod
-    def _create_schema(
-        schema_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
-    ) -> T:
-        """
-        Generic method to create a Pydantic schema instance.
-
-        Args:
-            schema_class: The Pydantic schema class to instantiate
-            defaults: Default values for the schema
-            overrides: Values to override defaults
-
-        Returns:
-            Schema instance with merged data
-        """
-        return schema_class(**(defaults | overrides))
-
-    @staticmethod
-    def _save_to_db(
-        db_session: Session,
-        model_class: Type[T],
-        defaults: Dict[str, Any],
-        overrides: Dict[str, Any],
-    ) -> T:
-        """
-        Generic method to save a model to database.
-
-        Args:
-            db_session: Database session
-            model_class: The SQLAlchemy model class to instantiate
-            defaults: Default values for the model
-            overrides: Values to override defaults
-
-        Returns:
-            Saved and refreshed model instance
-        """
-        # Remove fields that shouldn't be set when creating
-        data = {**defaults, **overrides}
-        data.pop("id", None)
-        data.pop("created_at", None)
-        data.pop("updated_at", None)
-
-        model = model_class(**data)
-        db_session.add(model)
-        db_session.commit()
-        db_session.refresh(model)
-        return model
-
     # ===== Company Grading =====
     @staticmethod
     def company_grading_model(**overrides) -> CompanyGrading:
@@ -159,9 +127,8 @@ class MockCompanyGradingDataBuilder:
             >>> assert isinstance(grading_read, CompanyGradingRead)
             >>> assert grading_read.recommendation == "STRONG BUY"
         """
-        return MockCompanyGradingDataBuilder._create_schema(
-            CompanyGradingRead,
-            MockCompanyGradingDataBuilder._GRADING_DEFAULTS,
+        return build_schema(
+            MockCompanyGradingDataBuilder._GRADING_READ_PROTOTYPE,
             overrides,
         )
 
@@ -179,7 +146,7 @@ class MockCompanyGradingDataBuilder:
                 Common overrides: symbol, grade, score, recommendation, date
 
         Returns:
-            CompanyGrading: Saved and refreshed SQLAlchemy model with DB-assigned ID
+            CompanyGrading: Saved SQLAlchemy model with DB-assigned ID
 
         Examples:
             >>> grading = MockCompanyGradingDataBuilder.save_company_grading(
@@ -191,13 +158,42 @@ class MockCompanyGradingDataBuilder:
             >>> assert grading.id is not None  # ID assigned by database
             >>> assert grading.created_at is not None
         """
-        return MockCompanyGradingDataBuilder._save_to_db(
+        return save_one(
             db_session,
             CompanyGrading,
-            MockCompanyGradingDataBuilder._GRADING_DEFAULTS,
+            MockCompanyGradingDataBuilder._GRADING_DB_DEFAULTS,
             overrides,
         )
 
+    @staticmethod
+    def save_many_company_gradings(
+        db_session: Session, overrides_list: Iterable[Dict[str, Any]]
+    ) -> list[CompanyGrading]:
+        """
+        Save several CompanyGrading rows to database with one bulk INSERT.
+
+        Use instead of calling the single-row helper in a loop when seeding
+        many gradings.
+
+        Args:
+            db_session: SQLAlchemy database session
+            overrides_list: One dict of overrides per row to insert
+
+        Returns:
+            list[CompanyGrading]: Saved SQLAlchemy models, in input order
+
+        Examples:
+            >>> rows = MockCompanyGradingDataBuilder.save_many_company_gradings(
+            ...     db_session, [{"symbol": "AAPL"}, {"symbol": "MSFT"}]
+            ... )
+        """
+        return save_many(
+            db_session,
+            CompanyGrading,
+            MockCompanyGradingDataBuilder._GRADING_DB_DEFAULTS,
+            overrides_list,
+        )
+
     # ===== Company Grading Summary =====
     @staticmethod
     def company_grading_summary_model(**overrides) -> CompanyGradingSummary:
@@ -253,9 +249,8 @@ class MockCompanyGradingDataBuilder:
             >>> assert isinstance(summary_read, CompanyGradingSummaryRead)
             >>> assert summary_read.consensus == "Hold"
         """
-        return MockCompanyGradingDataBuilder._create_schema(
-            CompanyGradingSummaryRead,
-            MockCompanyGradingDataBuilder._GRADING_SUMMARY_DEFAULTS,
+        return build_schema(
+            MockCompanyGradingDataBuilder._GRADING_SUMMARY_READ_PROTOTYPE,
             overrides,
         )
 
@@ -275,7 +270,7 @@ class MockCompanyGradingDataBuilder:
                 Common overrides: symbol, strong_buy, buy, hold, sell, strong_sell, consensus
 
         Returns:
-            CompanyGradingSummary: Saved and refreshed SQLAlchemy model with DB-assigned ID
+            CompanyGradingSummary: Saved SQLAlchemy model with DB-assigned ID
 
         Examples:
             >>> summary = MockCompanyGradingDataBuilder.save_company_grading_summary(
@@ -289,9 +284,42 @@ class MockCompanyGradingDataBuilder:
             >>> assert summary.id is not None  # ID assigned by database
             >>> assert summary.strong_buy == 8
         """
-        return MockCompanyGradingDataBuilder._save_to_db(
+        return save_one(
             db_session,
             CompanyGradingSummary,
-            MockCompanyGradingDataBuilder._GRADING_SUMMARY_DEFAULTS,
+            MockCompanyGradingDataBuilder._GRADING_SUMMARY_DB_DEFAULTS,
             overrides,
         )
+
+    @staticmethod
+    def save_many_company_grading_summaries(
+        db_session: Session, overrides_list: Iterable[Dict[str, Any]]
+    ) -> list[CompanyGradingSummary]:
+        """
+        Save several CompanyGradingSummary rows to database with one bulk INSERT.
+
+        Use instead of calling the single-row helper in a loop when seeding
+        many grading summaries.
+
+        Args:
+            db_session: SQLAlchemy database session
+            overrides_list: One dict of overrides per row to insert
+
+        Returns:
+            list[CompanyGradingSummary]: Saved SQLAlchemy models, in input order
+
+        Examples:
+            >>> rows = MockCompanyGradingDataBuilder.save_many_company_grading_summaries(
+            ...     db_session,
+            ...     [
+            ...         {"company_id": aapl.id, "symbol": "AAPL"},
+            ...         {"company_id": msft.id, "symbol": "MSFT"},
+            ...     ],
+            ... )
+        """
+        return save_many(
+            db_session,
+            CompanyGradingSummary,
+            MockCompanyGradingDataBuilder._GRADING_SUMMARY_DB_DEFAULTS,
+            overrides_list,
+        )
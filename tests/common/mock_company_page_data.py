@@ -1,4 +1,7 @@
+from functools import cache
+
 from app.schemas.company import CompanyPageResponse
+from app.schemas.financial_statements import CompanyFinancialRatioRead
 from tests.common.mock_company_data import MockCompanyDataBuilder
 from tests.common.mock_company_grading_data import (
     MockCompanyGradingDataBuilder,
@@ -12,20 +15,34 @@ from tests.common.mock_price_target_data import (
 )
 
 
+@cache
+def _default_company_page_response() -> CompanyPageResponse:
+    """Build the default CompanyPageResponse once, on first use."""
+    return CompanyPageResponse(
+        company=MockCompanyDataBuilder.company_read(),
+        ratios=CompanyFinancialRatioRead(symbol="TEST"),
+        grading_summary=MockCompanyGradingDataBuilder.company_grading_summary_read(),
+        rating_summary=MockCompanyRatingSummaryBuilder.company_rating_summary_read(),
+        dcf=MockDiscountedCashFlowDataBuilder.discounted_cash_flow_read(),
+        price_target=MockPriceTargetDataBuilder.price_target_read(),
+        stock_prices=[],
+        price_change=MockStockPriceChangeDataBuilder.stock_price_change_read(),
+        price_target_summary=MockPriceTargetDataBuilder.price_target_summary_read(),
+        latest_gradings=[MockCompanyGradingDataBuilder.company_grading_read()],
+        stock_news=[MockCompanyNewsDataBuilder.news_read()],
+    )
+
+
 class MockCompanyPageDataBuilder:
     @staticmethod
     def company_page_response(**overrides) -> CompanyPageResponse:
-        """Build complete CompanyPageResponse test data."""
-        defaults = {
-            "company": MockCompanyDataBuilder.company_read(),
-            "grading_summary": MockCompanyGradingDataBuilder.company_grading_summary_read(),
-            "rating_summary": MockCompanyRatingSummaryBuilder.company_rating_summary_read(),
-            "dcf": MockDiscountedCashFlowDataBuilder.discounted_cash_flow_read(),
-            "price_target": MockPriceTargetDataBuilder.price_target_read(),
-            "price_change": MockStockPriceChangeDataBuilder.stock_price_change_read(),
-            "price_target_summary": MockPriceTargetDataBuilder.price_target_summary_read(),
-            "general_news": [MockCompanyNewsDataBuilder.general_news_read()],
-            "price_target_news": [MockCompanyNewsDataBuilder.price_target_news_read()],
-            "grading_news": [MockCompanyNewsDataBuilder.grading_news_read()],
-        }
-        return CompanyPageResponse(**(defaults | overrides))
+        """Build complete CompanyPageResponse test data.
+
+        Returns a deep copy of a shared default page, so callers may mutate any
+        section. Overrides go through the CompanyPageResponse constructor and
+        are validated like the default sections.
+        """
+        page = _default_company_page_response().model_copy(deep=True)
+        if not overrides:
+            return page
+        return CompanyPageResponse(**(dict(page) | overrides))
@@ -1,8 +1,11 @@
-from typing import Type, TypeVar, Any, Dict
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Type, TypeVar, Any, Dict, Iterable, Mapping
 from sqlalchemy.orm import Session
 
 from app.schemas.market_data import CompanyRatingSummaryRead
 from app.db.models.ratings import CompanyRatingSummary
+from tests.common._persistence import build_schema, db_defaults, save_many, save_one
 
 T = TypeVar("T")
 
@@ -11,25 +14,33 @@ class MockCompanyRatingSummaryBuilder:
     """Builder for creating test data for company rating summary with minimal duplication."""
 
     # Define default data
-    _RATING_SUMMARY_DEFAULTS = {
-        "id": 1,
-        "company_id": 1,
-        "symbol": "TEST",
-        "rating": "Buy",
-        "overall_score": 4,
-        "discounted_cash_flow_score": 4,
-        "return_on_equity_score": 4,
-        "return_on_assets_score": 4,
-        "debt_to_equity_score": 3,
-        "price_to_earnings_score": 4,
-        "price_to_book_score": 4,
-        "created_at": "2023-10-01T00:00:00Z",
-        "updated_at": "2023-10-01T00:00:00Z",
-    }
+    _RATING_SUMMARY_DEFAULTS = MappingProxyType(
+        {
+            "id": 1,
+            "company_id": 1,
+            "symbol": "TEST",
+            "rating": "Buy",
+            "overall_score": 4,
+            "discounted_cash_flow_score": 4,
+            "return_on_equity_score": 4,
+            "return_on_assets_score": 4,
+            "debt_to_equity_score": 3,
+            "price_to_earnings_score": 4,
+            "price_to_book_score": 4,
+            "created_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+        }
+    )
+
+    _RATING_SUMMARY_DB_DEFAULTS = db_defaults(_RATING_SUMMARY_DEFAULTS)
+
+    _RATING_SUMMARY_READ_PROTOTYPE = CompanyRatingSummaryRead(
+        **_RATING_SUMMARY_DEFAULTS
+    )
 
     @staticmethod
     def _create_model(
-        model_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
+        model_class: Type[T], defaults: Mapping[str, Any], overrides: Dict[str, Any]
     ) -> T:
         """
         Generic method to create a model instance.
@@ -42,61 +53,13 @@ class MockCompanyRatingSummaryBuilder:
         Returns:
             Model instance with merged data
         """
-        data = {**defaults, **overrides}
+        data = defaults | overrides
         model = model_class(**data)
         # Manually set id since it's usually auto-generated
         if "id" in data:
             model.id = data["id"]
         return model
 
-    @staticmethod
-    def _create_schema(
-        schema_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
-    ) -> T:
-        """
-        Generic method to create a Pydantic schema instance.
-
-        Args:
-            schema_class: The Pydantic schema class to instantiate
-            defaults: Default values for the schema
-            overrides: Values to override defaults
-
-        Returns:
-            Schema instance with merged data
-        """
-        return schema_class(**(defaults | overrides))
-
-    @staticmethod
-    def _save_to_db(
-        db_session: Session,
-        model_class: Type[T],
-        defaults: Dict[str, Any],
-        overrides: Dict[str, Any],
-    ) -> T:
-        """
-        Generic method to save a model to database.
-
-        Args:
-            db_session: Database session
-            model_class: The SQLAlchemy model class to instantiate
-            defaults: Default values for the model
-            overrides: Values to override defaults
-
-        Returns:
-            Saved and refreshed model instance
-        """
-        # Remove fields that shouldn't be set when creating
-        data = {**defaults, **overrides}
-        data.pop("id", None)
-        data.pop("created_at", None)
-        data.pop("updated_at", None)
-
-        model = model_class(**data)
-        db_session.add(model)
-        db_session.commit()
-        db_session.refresh(model)
-        return model
-
     # ===== Company Rating Summary =====
     @staticmethod
     def company_rating_summary_model(**overrides) -> CompanyRatingSummary:
@@ -161,9 +124,8 @@ class MockCompanyRatingSummaryBuilder:
             >>> assert rating_read.return_on_equity_score == 5
             >>> assert rating_read.rating == "Buy"
         """
-        return MockCompanyRatingSummaryBuilder._create_schema(
-            CompanyRatingSummaryRead,
-            MockCompanyRatingSummaryBuilder._RATING_SUMMARY_DEFAULTS,
+        return build_schema(
+            MockCompanyRatingSummaryBuilder._RATING_SUMMARY_READ_PROTOTYPE,
             overrides,
         )
 
@@ -186,7 +148,7 @@ class MockCompanyRatingSummaryBuilder:
                 price_to_earnings_score, price_to_book_score
 
         Returns:
-            CompanyRatingSummary: Saved and refreshed SQLAlchemy model with DB-assigned ID
+            CompanyRatingSummary: Saved SQLAlchemy model with DB-assigned ID
 
         Examples:
             >>> rating = MockCompanyRatingSummaryBuilder.save_company_rating_summary(
@@ -202,9 +164,42 @@ class MockCompanyRatingSummaryBuilder:
             >>> assert rating.symbol == "MSFT"
             >>> assert rating.overall_score == 5
         """
-        return MockCompanyRatingSummaryBuilder._save_to_db(
+        return save_one(
             db_session,
             CompanyRatingSummary,
-            MockCompanyRatingSummaryBuilder._RATING_SUMMARY_DEFAULTS,
+            MockCompanyRatingSummaryBuilder._RATING_SUMMARY_DB_DEFAULTS,
             overrides,
         )
+
+    @staticmethod
+    def save_many_company_rating_summaries(
+        db_session: Session, overrides_list: Iterable[Dict[str, Any]]
+    ) -> list[CompanyRatingSummary]:
+        """
+        Save several CompanyRatingSummary rows to database with one bulk INSERT.
+
+        Use instead of calling the single-row helper in a loop when seeding
+        many rating summaries.
+
+        Args:
+            db_session: SQLAlchemy database session
+            overrides_list: One dict of overrides per row to insert
+
+        Returns:
+            list[CompanyRatingSummary]: Saved SQLAlchemy models, in input order
+
+        Examples:
+            >>> rows = MockCompanyRatingSummaryBuilder.save_many_company_rating_summaries(
+            ...     db_session,
+            ...     [
+            ...         {"company_id": aapl.id, "symbol": "AAPL"},
+            ...         {"company_id": msft.id, "symbol": "MSFT"},
+            ...     ],
+            ... )
+        """
+        return save_many(
+            db_session,
+            CompanyRatingSummary,
+            MockCompanyRatingSummaryBuilder._RATING_SUMMARY_DB_DEFAULTS,
+            overrides_list,
+        )
@@ -1,8 +1,11 @@
-from typing import Type, TypeVar, Any, Dict
+from datetime import date, datetime, timezone
+from types import MappingProxyType
+from typing import Type, TypeVar, Any, Dict, Iterable, Mapping
 from sqlalchemy.orm import Session
 
 from app.schemas.company_metrics import CompanyDiscountedCashFlowRead
-from app.db.models.dcf import DiscountedCashFlow
+from app.db.models.company_metrics import CompanyDiscountedCashFlow
+from tests.common._persistence import build_schema, db_defaults, save_many, save_one
 
 T = TypeVar("T")
 
@@ -11,20 +14,26 @@ class MockDiscountedCashFlowDataBuilder:
     """Builder for creating test data for discounted cash flow with minimal duplication."""
 
     # Define default data
-    _DCF_DEFAULTS = {
-        "id": 1,
-        "company_id": 1,
-        "symbol": "TEST",
-        "date": "2023-10-01",
-        "dcf": 175.0,
-        "stock_price": 160.0,
-        "created_at": "2023-10-01T00:00:00Z",
-        "updated_at": "2023-10-01T00:00:00Z",
-    }
+    _DCF_DEFAULTS = MappingProxyType(
+        {
+            "id": 1,
+            "company_id": 1,
+            "symbol": "TEST",
+            "date": date(2023, 10, 1),
+            "dcf": 175.0,
+            "stock_price": 160.0,
+            "created_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+        }
+    )
+
+    _DCF_DB_DEFAULTS = db_defaults(_DCF_DEFAULTS)
+
+    _DCF_READ_PROTOTYPE = CompanyDiscountedCashFlowRead(**_DCF_DEFAULTS)
 
     @staticmethod
     def _create_model(
-        model_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
+        model_class: Type[T], defaults: Mapping[str, Any], overrides: Dict[str, Any]
     ) -> T:
         """
         Generic method to create a model instance.
@@ -37,66 +46,18 @@ class MockDiscountedCashFlowDataBuilder:
         Returns:
             Model instance with merged data
         """
-        data = {**defaults, **overrides}
+        data = defaults | overrides
         model = model_class(**data)
         # Manually set id since it's usually auto-generated
         if "id" in data:
             model.id = data["id"]
         return model
 
-    @staticmethod
-    def _create_schema(
-        schema_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
-    ) -> T:
-        """
-        Generic method to create a Pydantic schema instance.
-
-        Args:
-            schema_class: The Pydantic schema class to instantiate
-            defaults: Default values for the schema
-            overrides: Values to override defaults
-
-        Returns:
-            Schema instance with merged data
-        """
-        return schema_class(**(defaults | overrides))
-
-    @staticmethod
-    def _save_to_db(
-        db_session: Session,
-        model_class: Type[T],
-        defaults: Dict[str, Any],
-        overrides: Dict[str, Any],
-    ) -> T:
-        """
-        Generic method to save a model to database.
-
-        Args:
-            db_session: Database session
-            model_class: The SQLAlchemy model class to instantiate
-            defaults: Default values for the model
-            overrides: Values to override defaults
-
-        Returns:
-            Saved and refreshed model instance
-        """
-        # Remove fields that shouldn't be set when creating
-        data = {**defaults, **overrides}
-        data.pop("id", None)
-        data.pop("created_at", None)
-        data.pop("updated_at", None)
-
-        model = model_class(**data)
-        db_session.add(model)
-        db_session.commit()
-        db_session.refresh(model)
-        return model
-
     # ===== Discounted Cash Flow =====
     @staticmethod
-    def discounted_cash_flow_model(**overrides) -> DiscountedCashFlow:
+    def discounted_cash_flow_model(**overrides) -> CompanyDiscountedCashFlow:
         """
-        Create a DiscountedCashFlow model instance (without saving to DB).
+        Create a CompanyDiscountedCashFlow model instance (without saving to DB).
 
         Use for integration tests where you need actual SQLAlchemy models.
         DCF represents the intrinsic value of a company based on projected future cash flows.
@@ -108,7 +69,7 @@ class MockDiscountedCashFlowDataBuilder:
                 date (valuation date)
 
         Returns:
-            DiscountedCashFlow: SQLAlchemy model instance
+            CompanyDiscountedCashFlow: SQLAlchemy model instance
 
         Examples:
             >>> dcf = MockDiscountedCashFlowDataBuilder.discounted_cash_flow_model(
@@ -116,12 +77,12 @@ class MockDiscountedCashFlowDataBuilder:
             ...     dcf=180.0,
             ...     stock_price=150.0
             ... )
-            >>> assert isinstance(dcf, DiscountedCashFlow)
+            >>> assert isinstance(dcf, CompanyDiscountedCashFlow)
             >>> assert dcf.dcf > dcf.stock_price  # Stock is undervalued
             >>> assert dcf.symbol == "AAPL"
         """
         return MockDiscountedCashFlowDataBuilder._create_model(
-            DiscountedCashFlow,
+            CompanyDiscountedCashFlow,
             MockDiscountedCashFlowDataBuilder._DCF_DEFAULTS,
             overrides,
         )
@@ -153,18 +114,17 @@ class MockDiscountedCashFlowDataBuilder:
             >>> assert dcf_read.dcf < dcf_read.stock_price  # Stock is overvalued
             >>> assert dcf_read.symbol == "GOOGL"
         """
-        return MockDiscountedCashFlowDataBuilder._create_schema(
-            CompanyDiscountedCashFlowRead,
-            MockDiscountedCashFlowDataBuilder._DCF_DEFAULTS,
+        return build_schema(
+            MockDiscountedCashFlowDataBuilder._DCF_READ_PROTOTYPE,
             overrides,
         )
 
     @staticmethod
     def save_discounted_cash_flow(
         db_session: Session, **overrides
-    ) -> DiscountedCashFlow:
+    ) -> CompanyDiscountedCashFlow:
         """
-        Save DiscountedCashFlow to database.
+        Save CompanyDiscountedCashFlow to database.
 
         Use for integration tests that require database persistence and relationship testing.
         Automatically removes auto-generated fields (id, timestamps) before insertion.
@@ -177,7 +137,7 @@ class MockDiscountedCashFlowDataBuilder:
                 date (valuation date)
 
         Returns:
-            DiscountedCashFlow: Saved and refreshed SQLAlchemy model with DB-assigned ID
+            CompanyDiscountedCashFlow: Saved SQLAlchemy model with DB-assigned ID
 
         Examples:
             >>> dcf = MockDiscountedCashFlowDataBuilder.save_discounted_cash_flow(
@@ -193,9 +153,42 @@ class MockDiscountedCashFlowDataBuilder:
             >>> assert dcf.dcf == 350.0
             >>> # DCF > stock_price indicates stock is undervalued
         """
-        return MockDiscountedCashFlowDataBuilder._save_to_db(
+        return save_one(
             db_session,
-            DiscountedCashFlow,
-            MockDiscountedCashFlowDataBuilder._DCF_DEFAULTS,
+            CompanyDiscountedCashFlow,
+            MockDiscountedCashFlowDataBuilder._DCF_DB_DEFAULTS,
             overrides,
         )
+
+    @staticmethod
+    def save_many_discounted_cash_flows(
+        db_session: Session, overrides_list: Iterable[Dict[str, Any]]
+    ) -> list[CompanyDiscountedCashFlow]:
+        """
+        Save several DCF rows to database with one bulk INSERT.
+
+        Use instead of calling the single-row helper in a loop when seeding
+        many valuations.
+
+        Args:
+            db_session: SQLAlchemy database session
+            overrides_list: One dict of overrides per row to insert
+
+        Returns:
+            list[CompanyDiscountedCashFlow]: Saved SQLAlchemy models, in input order
+
+        Examples:
+            >>> rows = MockDiscountedCashFlowDataBuilder.save_many_discounted_cash_flows(
+            ...     db_session,
+            ...     [
+            ...         {"company_id": aapl.id, "symbol": "AAPL"},
+            ...         {"company_id": msft.id, "symbol": "MSFT"},
+            ...     ],
+            ... )
+        """
+        return save_many(
+            db_session,
+            CompanyDiscountedCashFlow,
+            MockDiscountedCashFlowDataBuilder._DCF_DB_DEFAULTS,
+            overrides_list,
+        )
@@ -1,8 +1,11 @@
-from typing import Type, TypeVar, Any, Dict
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Type, TypeVar, Any, Dict, Mapping
 from sqlalchemy.orm import Session
 
 from app.schemas.quote import StockPriceChangeRead
-from app.db.models.quote import StockPriceChange
+from app.db.models.quote import CompanyStockPriceChange
+from tests.common._persistence import build_schema, db_defaults, save_one
 
 T = TypeVar("T")
 
@@ -11,27 +14,33 @@ class MockStockPriceChangeDataBuilder:
     """Builder for creating test data for stock price changes with minimal duplication."""
 
     # Define default data
-    _PRICE_CHANGE_DEFAULTS = {
-        "id": 1,
-        "company_id": 1,
-        "symbol": "AAPL",
-        "one_day": 2.5,
-        "five_day": 3.0,
-        "one_month": 5.0,
-        "three_month": 7.5,
-        "six_month": 10.0,
-        "ytd": 12.0,
-        "one_year": 15.0,
-        "three_year": 25.0,
-        "five_year": 40.0,
-        "ten_year": 80.0,
-        "created_at": "2023-10-01T00:00:00Z",
-        "updated_at": "2023-10-01T00:00:00Z",
-    }
+    _PRICE_CHANGE_DEFAULTS = MappingProxyType(
+        {
+            "id": 1,
+            "company_id": 1,
+            "symbol": "AAPL",
+            "one_day": 2.5,
+            "five_day": 3.0,
+            "one_month": 5.0,
+            "three_month": 7.5,
+            "six_month": 10.0,
+            "ytd": 12.0,
+            "one_year": 15.0,
+            "three_year": 25.0,
+            "five_year": 40.0,
+            "ten_year": 80.0,
+            "created_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2023, 10, 1, tzinfo=timezone.utc),
+        }
+    )
+
+    _PRICE_CHANGE_DB_DEFAULTS = db_defaults(_PRICE_CHANGE_DEFAULTS)
+
+    _PRICE_CHANGE_READ_PROTOTYPE = StockPriceChangeRead(**_PRICE_CHANGE_DEFAULTS)
 
     @staticmethod
     def _create_model(
-        model_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
+        model_class: Type[T], defaults: Mapping[str, Any], overrides: Dict[str, Any]
     ) -> T:
         """
         Generic method to create a model instance.
@@ -44,66 +53,18 @@ class MockStockPriceChangeDataBuilder:
         Returns:
             Model instance with merged data
         """
-        data = {**defaults, **overrides}
+        data = defaults | overrides
         model = model_class(**data)
         # Manually set id since it's usually auto-generated
         if "id" in data:
             model.id = data["id"]
         return model
 
-    @staticmethod
-    def _create_schema(
-        schema_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
-    ) -> T:
-        """
-        Generic method to create a Pydantic schema instance.
-
-        Args:
-            schema_class: The Pydantic schema class to instantiate
-            defaults: Default values for the schema
-            overrides: Values to override defaults
-
-        Returns:
-            Schema instance with merged data
-        """
-        return schema_class(**(defaults | overrides))
-
-    @staticmethod
-    def _save_to_db(
-        db_session: Session,
-        model_class: Type[T],
-        defaults: Dict[str, Any],
-        overrides: Dict[str, Any],
-    ) -> T:
-        """
-        Generic method to save a model to database.
-
-        Args:
-            db_session: Database session
-            model_class: The SQLAlchemy model class to instantiate
-            defaults: Default values for the model
-            overrides: Values to override defaults
-
-        Returns:
-            Saved and refreshed model instance
-        """
-        # Remove fields that shouldn't be set when creating
-        data = {**defaults, **overrides}
-        data.pop("id", None)
-        data.pop("created_at", None)
-        data.pop("updated_at", None)
-
-        model = model_class(**data)
-        db_session.add(model)
-        db_session.commit()
-        db_session.refresh(model)
-        return model
-
     # ===== Stock Price Change =====
     @staticmethod
-    def stock_price_change_model(**overrides) -> StockPriceChange:
+    def stock_price_change_model(**overrides) -> CompanyStockPriceChange:
         """
-        Create a StockPriceChange model instance (without saving to DB).
+        Create a CompanyStockPriceChange model instance (without saving to DB).
 
         Use for integration tests where you need actual SQLAlchemy models.
         Tracks historical price performance across multiple timeframes (1 day to 10 years).
@@ -115,7 +76,7 @@ class MockStockPriceChangeDataBuilder:
                 six_month, ytd, one_year, three_year, five_year, ten_year
 
         Returns:
-            StockPriceChange: SQLAlchemy model instance
+            CompanyStockPriceChange: SQLAlchemy model instance
 
         Examples:
             >>> price_change = MockStockPriceChangeDataBuilder.stock_price_change_model(
@@ -124,12 +85,12 @@ class MockStockPriceChangeDataBuilder:
             ...     one_month=8.0,
             ...     one_year=25.0
             ... )
-            >>> assert isinstance(price_change, StockPriceChange)
+            >>> assert isinstance(price_change, CompanyStockPriceChange)
             >>> assert price_change.one_year > price_change.one_month  # Long-term gain
             >>> assert price_change.symbol == "AAPL"
         """
         return MockStockPriceChangeDataBuilder._create_model(
-            StockPriceChange,
+            CompanyStockPriceChange,
             MockStockPriceChangeDataBuilder._PRICE_CHANGE_DEFAULTS,
             overrides,
         )
@@ -163,16 +124,17 @@ class MockStockPriceChangeDataBuilder:
             >>> assert price_change_read.five_year > 0  # Long-term growth
             >>> assert price_change_read.symbol == "TSLA"
         """
-        return MockStockPriceChangeDataBuilder._create_schema(
-            StockPriceChangeRead,
-            MockStockPriceChangeDataBuilder._PRICE_CHANGE_DEFAULTS,
+        return build_schema(
+            MockStockPriceChangeDataBuilder._PRICE_CHANGE_READ_PROTOTYPE,
             overrides,
         )
 
     @staticmethod
-    def save_stock_price_change(db_session: Session, **overrides) -> StockPriceChange:
+    def save_stock_price_change(
+        db_session: Session, **overrides
+    ) -> CompanyStockPriceChange:
         """
-        Save StockPriceChange to database.
+        Save CompanyStockPriceChange to database.
 
         Use for integration tests that require database persistence and relationship testing.
         Automatically removes auto-generated fields (id, timestamps) before insertion.
@@ -185,7 +147,7 @@ class MockStockPriceChangeDataBuilder:
                 six_month, ytd, one_year, three_year, five_year, ten_year
 
         Returns:
-            StockPriceChange: Saved and refreshed SQLAlchemy model with DB-assigned ID
+            CompanyStockPriceChange: Saved SQLAlchemy model with DB-assigned ID
 
         Examples:
             >>> price_change = MockStockPriceChangeDataBuilder.save_stock_price_change(
@@ -203,9 +165,9 @@ class MockStockPriceChangeDataBuilder:
             >>> assert price_change.ytd == 18.5
             >>> # Positive values across all periods indicate consistent growth
         """
-        return MockStockPriceChangeDataBuilder._save_to_db(
+        return save_one(
             db_session,
-            StockPriceChange,
-            MockStockPriceChangeDataBuilder._PRICE_CHANGE_DEFAULTS,
+            CompanyStockPriceChange,
+            MockStockPriceChangeDataBuilder._PRICE_CHANGE_DB_DEFAULTS,
             overrides,
         )
@@ -1,4 +1,6 @@
-from typing import Type, TypeVar, Any, Dict
+from datetime import datetime
+from types import MappingProxyType
+from typing import Type, TypeVar, Any, Dict, Mapping
 from sqlalchemy.orm import Session
 
 from app.schemas.market_data import (
@@ -6,6 +8,7 @@ from app.schemas.market_data import (
     CompanyPriceTargetSummaryRead,
 )
 from app.db.models.price_target import CompanyPriceTarget, CompanyPriceTargetSummary
+from tests.common._persistence import build_schema, db_defaults, save_one
 
 T = TypeVar("T")
 
@@ -14,38 +17,50 @@ class MockPriceTargetDataBuilder:
     """Builder for creating test data for price targets with minimal duplication."""
 
     # Define default data for each type
-    _PRICE_TARGET_DEFAULTS = {
-        "id": 1,
-        "company_id": 1,
-        "symbol": "TEST",
-        "target_high": 150.0,
-        "target_low": 100.0,
-        "target_consensus": 125.0,
-        "target_median": 130.0,
-        "created_at": "2023-10-01T00:00:00",
-        "updated_at": "2023-10-01T00:00:00",
-    }
-
-    _PRICE_TARGET_SUMMARY_DEFAULTS = {
-        "id": 1,
-        "company_id": 1,
-        "symbol": "TEST",
-        "last_month_count": 5,
-        "last_month_average_price_target": 128.0,
-        "last_quarter_count": 15,
-        "last_quarter_average_price_target": 130.0,
-        "last_year_count": 60,
-        "last_year_average_price_target": 127.5,
-        "all_time_count": 200,
-        "all_time_average_price_target": 125.0,
-        "publishers": "Analyst A, Analyst B",
-        "created_at": "2023-10-01T00:00:00",
-        "updated_at": "2023-10-01T00:00:00",
-    }
+    _PRICE_TARGET_DEFAULTS = MappingProxyType(
+        {
+            "id": 1,
+            "company_id": 1,
+            "symbol": "TEST",
+            "target_high": 150.0,
+            "target_low": 100.0,
+            "target_consensus": 125.0,
+            "target_median": 130.0,
+            "created_at": datetime(2023, 10, 1),
+            "updated_at": datetime(2023, 10, 1),
+        }
+    )
+
+    _PRICE_TARGET_SUMMARY_DEFAULTS = MappingProxyType(
+        {
+            "id": 1,
+            "company_id": 1,
+            "symbol": "TEST",
+            "last_month_count": 5,
+            "last_month_average_price_target": 128.0,
+            "last_quarter_count": 15,
+            "last_quarter_average_price_target": 130.0,
+            "last_year_count": 60,
+            "last_year_average_price_target": 127.5,
+            "all_time_count": 200,
+            "all_time_average_price_target": 125.0,
+            "publishers": "Analyst A, Analyst B",
+            "created_at": datetime(2023, 10, 1),
+            "updated_at": datetime(2023, 10, 1),
+        }
+    )
+
+    _PRICE_TARGET_DB_DEFAULTS = db_defaults(_PRICE_TARGET_DEFAULTS)
+    _PRICE_TARGET_SUMMARY_DB_DEFAULTS = db_defaults(_PRICE_TARGET_SUMMARY_DEFAULTS)
+
+    _PRICE_TARGET_READ_PROTOTYPE = CompanyPriceTargetRead(**_PRICE_TARGET_DEFAULTS)
+    _PRICE_TARGET_SUMMARY_READ_PROTOTYPE = CompanyPriceTargetSummaryRead(
+        **_PRICE_TARGET_SUMMARY_DEFAULTS
+    )
 
     @staticmethod
     def _create_model(
-        model_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
+        model_class: Type[T], defaults: Mapping[str, Any], overrides: Dict[str, Any]
     ) -> T:
         """
         Generic method to create a model instance.
@@ -58,61 +73,13 @@ class MockPriceTargetDataBuilder:
         Returns:
             Model instance with merged data
         """
-        data = {**defaults, **overrides}
+        data = defaults | overrides
         model = model_class(**data)
         # Manually set id since it's usually auto-generated
         if "id" in data:
             model.id = data["id"]
         return model
 
-    @staticmethod
-    def _create_schema(
-        schema_class: Type[T], defaults: Dict[str, Any], overrides: Dict[str, Any]
-    ) -> T:
-        """
-        Generic method to create a Pydantic schema instance.
-
-        Args:
-            schema_class: The Pydantic schema class to instantiate
-            defaults: Default values for the schema
-            overrides: Values to override defaults
-
-        Returns:
-            Schema instance with merged data
-        """
-        return schema_class(**(defaults | overrides))
-
-    @staticmethod
-    def _save_to_db(
-        db_session: Session,
-        model_class: Type[T],
-        defaults: Dict[str, Any],
-        overrides: Dict[str, Any],
-    ) -> T:
-        """
-        Generic method to save a model to database.
-
-        Args:
-            db_session: Database session
-            model_class: The SQLAlchemy model class to instantiate
-            defaults: Default values for the model
-            overrides: Values to override defaults
-
-        Returns:
-            Saved and refreshed model instance
-        """
-        # Remove fields that shouldn't be set when creating
-        data = {**defaults, **overrides}
-        data.pop("id", None)
-        data.pop("created_at", None)
-        data.pop("updated_at", None)
-
-        model = model_class(**data)
-        db_session.add(model)
-        db_session.commit()
-        db_session.refresh(model)
-        return model
-
     # ===== Price Target =====
     @staticmethod
     def price_target_model(**overrides) -> CompanyPriceTarget:
@@ -176,9 +143,8 @@ class MockPriceTargetDataBuilder:
             >>> assert price_target_read.target_median == 250.0
             >>> # Median between high and low indicates balanced analyst views
         """
-        return MockPriceTargetDataBuilder._create_schema(
-            CompanyPriceTargetRead,
-            MockPriceTargetDataBuilder._PRICE_TARGET_DEFAULTS,
+        return build_schema(
+            MockPriceTargetDataBuilder._PRICE_TARGET_READ_PROTOTYPE,
             overrides,
         )
 
@@ -198,7 +164,7 @@ class MockPriceTargetDataBuilder:
                 target_median
 
         Returns:
-            CompanyPriceTarget: Saved and refreshed SQLAlchemy model with DB-assigned ID
+            CompanyPriceTarget: Saved SQLAlchemy model with DB-assigned ID
 
         Examples:
             >>> price_target = MockPriceTargetDataBuilder.save_price_target(
@@ -213,10 +179,10 @@ class MockPriceTargetDataBuilder:
             >>> assert price_target.created_at is not None
             >>> assert price_target.symbol == "GOOGL"
         """
-        return MockPriceTargetDataBuilder._save_to_db(
+        return save_one(
             db_session,
             CompanyPriceTarget,
-            MockPriceTargetDataBuilder._PRICE_TARGET_DEFAULTS,
+            MockPriceTargetDataBuilder._PRICE_TARGET_DB_DEFAULTS,
             overrides,
         )
 
@@ -289,9 +255,8 @@ class MockPriceTargetDataBuilder:
             >>> # Rising average indicates improving analyst sentiment
             >>> assert summary_read.last_month_average_price_target > summary_read.last_year_average_price_target
         """
-        return MockPriceTargetDataBuilder._create_schema(
-            CompanyPriceTargetSummaryRead,
-            MockPriceTargetDataBuilder._PRICE_TARGET_SUMMARY_DEFAULTS,
+        return build_schema(
+            MockPriceTargetDataBuilder._PRICE_TARGET_SUMMARY_READ_PROTOTYPE,
             overrides,
         )
 
@@ -315,7 +280,7 @@ class MockPriceTargetDataBuilder:
                 publishers
 
         Returns:
-            CompanyPriceTargetSummary: Saved and refreshed SQLAlchemy model with DB-assigned ID
+            CompanyPriceTargetSummary: Saved SQLAlchemy model with DB-assigned ID
 
         Examples:
             >>> summary = MockPriceTargetDataBuilder.save_price_target_summary(
@@ -331,9 +296,9 @@ class MockPriceTargetDataBuilder:
             >>> assert summary.last_month_count == 6
             >>> assert "Morgan Stanley" in summary.publishers
         """
-        return MockPriceTargetDataBuilder._save_to_db(
+        return save_one(
             db_session,
             CompanyPriceTargetSummary,
-            MockPriceTargetDataBuilder._PRICE_TARGET_SUMMARY_DEFAULTS,
+            MockPriceTargetDataBuilder._PRICE_TARGET_SUMMARY_DB_DEFAULTS,
             overrides,
         )
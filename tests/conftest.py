@@ -2,8 +2,8 @@ import os
 import sys
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 from starlette.testclient import TestClient
 
@@ -12,7 +12,10 @@ from app.main import app
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-DATABASE_URL = "sqlite:///./test_stockmate.db"
+# One SQLite file per xdist worker so parallel runs (pytest -n auto) do not
+# drop and recreate each other's tables
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+DATABASE_URL = f"sqlite:///./test_stockmate_{_WORKER_ID}.db"
 
 engine = create_engine(
     DATABASE_URL,
@@ -20,24 +23,78 @@ engine = create_engine(
     poolclass=StaticPool,
 )
 
+
+# pysqlite commits implicitly around DDL and ignores SAVEPOINT semantics; let
+# SQLAlchemy emit BEGIN itself so nested transactions roll back properly
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Provide a fresh DB session for each test."""
+@pytest.fixture(scope="session")
+def db_schema():
+    """Create empty tables once per session."""
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
 
+
+@pytest.fixture(scope="function")
+def db_session(db_schema):
+    """Provide a fresh DB session for each test.
+
+    Prefer transactional_db_session; use this only when a test needs its
+    commits to be visible to another connection.
+    """
     db = TestingSessionLocal()
     try:
         yield db
     finally:
         db.close()
+        # Its commits are real, so empty the tables (children first) for the
+        # next test; the schema from db_schema is kept
+        with engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                connection.execute(table.delete())
 
 
-@pytest.fixture
+@pytest.fixture(scope="function")
+def transactional_db_session(db_schema):
+    """Provide a DB session whose writes are rolled back after the test.
+
+    The session runs inside one outer transaction, so the builders' save_*
+    commits only release a SAVEPOINT and nothing reaches the database file.
+    This is the default for database-backed tests in tests/repositories.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield db
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
 def client():
+    """Share one TestClient across the session.
+
+    Tests isolate themselves through app.dependency_overrides, which they set and
+    clear in their own fixtures.
+    """
     return TestClient(app)
 
 
@@ -0,0 +1,90 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.repositories.market_data_repo import CompanyMarketDataRepository
+from tests.common.mock_company_data import MockCompanyDataBuilder
+from tests.common.mock_company_grading_data import MockCompanyGradingDataBuilder
+from tests.common.mock_company_news_data import MockCompanyNewsDataBuilder
+
+
+@pytest.fixture
+def companies(transactional_db_session):
+    """Persist AAPL and MSFT with one bulk INSERT."""
+    return MockCompanyDataBuilder.save_many_companies(
+        transactional_db_session, [{"symbol": "AAPL"}, {"symbol": "MSFT"}]
+    )
+
+
+@pytest.fixture
+def repository(transactional_db_session):
+    """Create CompanyMarketDataRepository bound to the rolled-back session."""
+    return CompanyMarketDataRepository(transactional_db_session)
+
+
+class TestCompanyMarketDataRepository:
+    """Database-backed tests for CompanyMarketDataRepository reads."""
+
+    def test_get_grading_summary(self, repository, companies, transactional_db_session):
+        """Test that each company's grading summary is returned by symbol."""
+        # Arrange
+        aapl, msft = companies
+        MockCompanyGradingDataBuilder.save_many_company_grading_summaries(
+            transactional_db_session,
+            [
+                {"company_id": aapl.id, "symbol": "AAPL", "consensus": "Buy"},
+                {"company_id": msft.id, "symbol": "MSFT", "consensus": "Hold"},
+            ],
+        )
+
+        # Act
+        summary = repository.get_grading_summary("MSFT")
+
+        # Assert
+        assert summary.company_id == msft.id
+        assert summary.consensus == "Hold"
+        assert repository.get_grading_summary("TSLA") is None
+
+    def test_get_gradings_newest_first(
+        self, repository, companies, transactional_db_session
+    ):
+        """Test that gradings are filtered by symbol, newest first, up to limit."""
+        # Arrange
+        aapl, msft = companies
+        MockCompanyGradingDataBuilder.save_many_company_gradings(
+            transactional_db_session,
+            [
+                {"company_id": aapl.id, "symbol": "AAPL", "date": date(2024, 1, 1)},
+                {"company_id": aapl.id, "symbol": "AAPL", "date": date(2024, 3, 1)},
+                {"company_id": aapl.id, "symbol": "AAPL", "date": date(2024, 2, 1)},
+                {"company_id": msft.id, "symbol": "MSFT", "date": date(2024, 4, 1)},
+            ],
+        )
+
+        # Act
+        gradings = repository.get_gradings("AAPL", limit=2)
+
+        # Assert
+        assert [g.date for g in gradings] == [date(2024, 3, 1), date(2024, 2, 1)]
+
+    def test_get_stock_news_within_range(self, repository, transactional_db_session):
+        """Test that stock news is filtered by symbol and published date."""
+        # Arrange
+        MockCompanyNewsDataBuilder.save_many_news(
+            transactional_db_session,
+            [
+                {"symbol": "AAPL", "published_date": datetime(2024, 1, 5)},
+                {"symbol": "AAPL", "published_date": datetime(2024, 2, 5)},
+                {"symbol": "AAPL", "published_date": datetime(2024, 3, 5)},
+                {"symbol": "MSFT", "published_date": datetime(2024, 2, 5)},
+            ],
+        )
+
+        # Act
+        news = repository.get_stock_news("AAPL", "2024-02-01", "2024-03-31")
+
+        # Assert
+        assert [n.published_date for n in news] == [
+            datetime(2024, 3, 5),
+            datetime(2024, 2, 5),
+        ]
@@ -0,0 +1,79 @@
+import pytest
+
+from app.db.models.ratings import CompanyRatingSummary
+from app.repositories.internal.market_data_sync_repo import (
+    CompanyMarketDataSyncRepository,
+)
+from app.schemas.market_data import CompanyRatingSummaryWrite
+from tests.common.mock_company_data import MockCompanyDataBuilder
+from tests.common.mock_company_rating_data import MockCompanyRatingSummaryBuilder
+
+
+@pytest.fixture
+def companies(transactional_db_session):
+    """Persist AAPL and MSFT with one bulk INSERT."""
+    return MockCompanyDataBuilder.save_many_companies(
+        transactional_db_session, [{"symbol": "AAPL"}, {"symbol": "MSFT"}]
+    )
+
+
+@pytest.fixture
+def repository(transactional_db_session):
+    """Create CompanyMarketDataSyncRepository bound to the rolled-back session."""
+    return CompanyMarketDataSyncRepository(transactional_db_session)
+
+
+class TestCompanyMarketDataSyncRepositoryRatings:
+    """Database-backed tests for rating summary upserts."""
+
+    def test_upsert_rating_summary_updates_existing(
+        self, repository, companies, transactional_db_session
+    ):
+        """Test that an existing summary is updated in place, others untouched."""
+        # Arrange
+        aapl, msft = companies
+        existing, _ = (
+            MockCompanyRatingSummaryBuilder.save_many_company_rating_summaries(
+                transactional_db_session,
+                [
+                    {"company_id": aapl.id, "symbol": "AAPL"},
+                    {"company_id": msft.id, "symbol": "MSFT"},
+                ],
+            )
+        )
+
+        # Act
+        result = repository.upsert_rating_summary(
+            CompanyRatingSummaryWrite(
+                company_id=aapl.id, symbol="AAPL", rating="Sell", overall_score=1
+            )
+        )
+
+        # Assert
+        assert result.id == existing.id
+        assert (result.rating, result.overall_score) == ("Sell", 1)
+        msft_summary = (
+            transactional_db_session.query(CompanyRatingSummary)
+            .filter_by(symbol="MSFT")
+            .one()
+        )
+        assert msft_summary.rating == "Buy"
+
+    def test_upsert_rating_summary_inserts_new(
+        self, repository, companies, transactional_db_session
+    ):
+        """Test that a symbol without a summary gets a new row."""
+        # Arrange
+        aapl, msft = companies
+        MockCompanyRatingSummaryBuilder.save_many_company_rating_summaries(
+            transactional_db_session, [{"company_id": aapl.id, "symbol": "AAPL"}]
+        )
+
+        # Act
+        result = repository.upsert_rating_summary(
+            CompanyRatingSummaryWrite(company_id=msft.id, symbol="MSFT", rating="Hold")
+        )
+
+        # Assert
+        assert result.id is not None
+        assert transactional_db_session.query(CompanyRatingSummary).count() == 2
@@ -0,0 +1,133 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+
+from app.db.models.portfolio import Portfolio, PortfolioDividendHistory
+from app.db.models.user import User
+from app.repositories.portfolio_repo import PortfolioRepository
+from app.schemas.user import PortfolioDividendHistoryWrite
+
+
+@pytest.fixture
+def portfolio(transactional_db_session):
+    """Persist a user with one empty portfolio."""
+    user = User(username="investor", email="investor@example.com", hashed_password="x")
+    portfolio = Portfolio(user=user, name="Core")
+    transactional_db_session.add(portfolio)
+    transactional_db_session.commit()
+    return portfolio
+
+
+@pytest.fixture
+def repository(transactional_db_session):
+    """Create PortfolioRepository bound to the rolled-back session."""
+    return PortfolioRepository(transactional_db_session)
+
+
+def _dividend(
+    portfolio_id: int, symbol: str, payment_date: date, amount: float
+) -> PortfolioDividendHistoryWrite:
+    return PortfolioDividendHistoryWrite(
+        portfolio_id=portfolio_id,
+        symbol=symbol,
+        shares=10.0,
+        dividend_per_share=amount / 10.0,
+        dividend_amount=amount,
+        currency="USD",
+        declaration_date=date(2024, 1, 1),
+        payment_date=payment_date,
+    )
+
+
+class TestPortfolioRepositoryDividends:
+    """Database-backed tests for PortfolioRepository dividend writes."""
+
+    def test_add_dividends_inserts_new_and_updates_existing(
+        self, repository, portfolio, transactional_db_session
+    ):
+        """Test that a batch updates matching rows in place and inserts the rest."""
+        # Arrange
+        existing = repository.add_dividend(
+            _dividend(portfolio.id, "AAPL", date(2024, 2, 1), 5.0)
+        )
+
+        # Act
+        records = repository.add_dividends(
+            [
+                _dividend(portfolio.id, "AAPL", date(2024, 2, 1), 6.0),
+                _dividend(portfolio.id, "AAPL", date(2024, 5, 1), 7.0),
+                _dividend(portfolio.id, "MSFT", date(2024, 3, 1), 8.0),
+            ]
+        )
+
+        # Assert
+        assert [r.dividend_amount for r in records] == [6.0, 7.0, 8.0]
+        assert records[0].id == existing.id
+        assert all(r.id is not None for r in records)
+        rows = transactional_db_session.query(PortfolioDividendHistory).all()
+        assert len(rows) == 3
+
+    def test_add_dividends_empty_batch(self, repository):
+        """Test that an empty batch is a no-op."""
+        # Act & Assert
+        assert repository.add_dividends([]) == []
+
+
+class TestPortfolioRepositoryDividendsReceived:
+    """Tests that Portfolio.dividends_received tracks the dividend history."""
+
+    @staticmethod
+    def _assert_matches_history(db_session, portfolio: Portfolio) -> None:
+        history_total = db_session.scalar(
+            select(
+                func.coalesce(func.sum(PortfolioDividendHistory.dividend_amount), 0)
+            ).where(PortfolioDividendHistory.portfolio_id == portfolio.id)
+        )
+        db_session.refresh(portfolio)
+        assert portfolio.dividends_received == pytest.approx(history_total)
+
+    def test_dividends_received_after_add_dividend(
+        self, repository, portfolio, transactional_db_session
+    ):
+        """Test that single dividend writes add to the running total."""
+        # Act
+        repository.add_dividend(_dividend(portfolio.id, "AAPL", date(2024, 2, 1), 5.0))
+        repository.add_dividend(_dividend(portfolio.id, "MSFT", date(2024, 3, 1), 2.5))
+
+        # Assert
+        self._assert_matches_history(transactional_db_session, portfolio)
+        assert portfolio.dividends_received == pytest.approx(7.5)
+
+    def test_dividends_received_after_add_dividends(
+        self, repository, portfolio, transactional_db_session
+    ):
+        """Test that a batch write adds every new dividend to the total."""
+        # Act
+        repository.add_dividends(
+            [
+                _dividend(portfolio.id, "AAPL", date(2024, 2, 1), 5.0),
+                _dividend(portfolio.id, "MSFT", date(2024, 3, 1), 2.5),
+            ]
+        )
+
+        # Assert
+        self._assert_matches_history(transactional_db_session, portfolio)
+        assert portfolio.dividends_received == pytest.approx(7.5)
+
+    def test_dividends_received_after_updating_existing_row(
+        self, repository, portfolio, transactional_db_session
+    ):
+        """Test that rewriting a dividend applies only the difference."""
+        # Arrange
+        repository.add_dividend(_dividend(portfolio.id, "AAPL", date(2024, 2, 1), 5.0))
+
+        # Act
+        repository.add_dividend(_dividend(portfolio.id, "AAPL", date(2024, 2, 1), 4.0))
+        repository.add_dividends(
+            [_dividend(portfolio.id, "AAPL", date(2024, 2, 1), 6.0)]
+        )
+
+        # Assert
+        self._assert_matches_history(transactional_db_session, portfolio)
+        assert portfolio.dividends_received == pytest.approx(6.0)
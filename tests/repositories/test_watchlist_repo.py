@@ -0,0 +1,105 @@
+import pytest
+
+from app.db.models.user import User
+from app.db.models.watchlist import Watchlist, WatchlistItem
+from app.repositories.watchlist_repo import WatchlistRepository
+from app.schemas.user import WatchlistItemCreate
+
+
+@pytest.fixture
+def watchlist(transactional_db_session):
+    """Persist a user with one watchlist holding AAPL."""
+    user = User(username="watcher", email="watcher@example.com", hashed_password="x")
+    watchlist = Watchlist(user=user, name="Tech", items=[WatchlistItem(symbol="AAPL")])
+    transactional_db_session.add(watchlist)
+    transactional_db_session.commit()
+    return watchlist
+
+
+@pytest.fixture
+def repository(transactional_db_session):
+    """Create WatchlistRepository bound to the rolled-back session."""
+    return WatchlistRepository(transactional_db_session)
+
+
+class TestWatchlistRepositoryBulkAdd:
+    """Database-backed tests for the bulk watchlist item writes."""
+
+    def test_get_existing_watchlist_symbols(self, repository, watchlist):
+        """Test that only symbols already in the watchlist are returned."""
+        # Act
+        existing = repository.get_existing_watchlist_symbols(
+            watchlist.id, ["AAPL", "MSFT"]
+        )
+
+        # Assert
+        assert existing == {"AAPL"}
+
+    def test_bulk_add_returns_rows_in_symbol_order(
+        self, repository, watchlist, transactional_db_session
+    ):
+        """Test that the re-SELECT returns the new rows in insert order."""
+        # Arrange
+        symbols = ["TSLA", "AMZN", "MSFT", "GOOG"]
+
+        # Act
+        items = repository.bulk_add_watchlist_items(watchlist.id, symbols)
+
+        # Assert
+        assert [item.symbol for item in items] == symbols
+        assert all(item.watchlist_id == watchlist.id for item in items)
+        count = (
+            transactional_db_session.query(WatchlistItem)
+            .filter_by(watchlist_id=watchlist.id)
+            .count()
+        )
+        assert count == 5
+
+    def test_bulk_add_empty_batch(self, repository, watchlist):
+        """Test that an empty batch is a no-op."""
+        # Act & Assert
+        assert repository.bulk_add_watchlist_items(watchlist.id, []) == []
+
+
+class TestWatchlistRepositoryItemsVersion:
+    """Tests that item writes bump the watchlist items version."""
+
+    def _version(self, repository, watchlist) -> int:
+        return repository.get_watchlist_items_version(watchlist.id, watchlist.user_id)
+
+    def test_get_watchlist_items_version_access_denied(self, repository, watchlist):
+        """Test that another user's watchlist has no items version."""
+        # Act & Assert
+        assert repository.get_watchlist_items_version(watchlist.id, -1) is None
+
+    def test_add_watchlist_item_bumps_version(self, repository, watchlist):
+        """Test that a single add increments items_version."""
+        # Act
+        repository.add_watchlist_item(
+            WatchlistItemCreate(watchlist_id=watchlist.id, symbol="MSFT")
+        )
+
+        # Assert
+        assert self._version(repository, watchlist) == 1
+
+    def test_writes_in_the_same_second_bump_version_each_time(
+        self, repository, watchlist
+    ):
+        """Test that back-to-back writes each produce a new version."""
+        # Act
+        repository.bulk_add_watchlist_items(watchlist.id, ["MSFT"])
+        repository.bulk_add_watchlist_items(watchlist.id, ["GOOG"])
+
+        # Assert
+        assert self._version(repository, watchlist) == 2
+
+    def test_delete_watchlist_item_bumps_version(self, repository, watchlist):
+        """Test that deleting an item increments items_version."""
+        # Act
+        deleted = repository.delete_watchlist_item(
+            watchlist.id, watchlist.items[0].id, watchlist.user_id
+        )
+
+        # Assert
+        assert deleted
+        assert self._version(repository, watchlist) == 1
@@ -0,0 +1,112 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.dependencies.sync_services import get_pubsub_handler
+from app.services.internal.company_sync_service import CompanySyncService
+from app.services.pubsub_handler import PubSubHandler
+
+
+class TestPubSubHandler:
+    """Test suite for PubSubHandler batch company sync."""
+
+    @pytest.fixture
+    def sessions(self):
+        """Collect every session handed out to a sync worker."""
+        return []
+
+    @pytest.fixture
+    def session_factory(self, sessions):
+        """Create a fresh mock session per call and record it."""
+
+        def factory():
+            session = MagicMock(spec=Session)
+            sessions.append(session)
+            return session
+
+        return factory
+
+    @staticmethod
+    def _sync_service_factory(failing_symbols: set[str]):
+        def factory(session):
+            service = MagicMock()
+
+            def upsert_company(symbol):
+                if symbol in failing_symbols:
+                    raise RuntimeError(f"FMP error for {symbol}")
+
+            service.upsert_company.side_effect = upsert_company
+            return service
+
+        return factory
+
+    def test_sync_company_batch_reports_failure_without_aborting(self, session_factory):
+        """Test that one failing symbol is reported and the others still sync."""
+        # Arrange
+        handler = PubSubHandler(
+            self._sync_service_factory({"MSFT"}), session_factory=session_factory
+        )
+        message = {"action": "sync_company_batch", "symbols": ["AAPL", "MSFT", "GOOG"]}
+
+        # Act
+        result = asyncio.run(handler.handle_message(message))
+
+        # Assert
+        assert result["status"] == "completed"
+        assert result["total"] == 3
+        assert result["success"] == 2
+        assert result["failed"] == 1
+        assert result["results"]["AAPL"] == "success"
+        assert result["results"]["GOOG"] == "success"
+        assert result["results"]["MSFT"] == "error: FMP error for MSFT"
+
+    def test_sync_company_batch_closes_each_worker_session(
+        self, session_factory, sessions
+    ):
+        """Test that every worker gets its own session and closes it."""
+        # Arrange
+        handler = PubSubHandler(
+            self._sync_service_factory({"MSFT"}), session_factory=session_factory
+        )
+        message = {"action": "sync_company_batch", "symbols": ["AAPL", "MSFT", "GOOG"]}
+
+        # Act
+        asyncio.run(handler.handle_message(message))
+
+        # Assert
+        assert len(sessions) == 3
+        for session in sessions:
+            session.close.assert_called_once_with()
+
+    def test_sync_company_batch_missing_symbols(self, session_factory):
+        """Test that a batch without symbols is rejected."""
+        # Arrange
+        handler = PubSubHandler(
+            self._sync_service_factory(set()), session_factory=session_factory
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Missing 'symbols' in message"):
+            asyncio.run(handler.handle_message({"action": "sync_company_batch"}))
+
+    def test_get_pubsub_handler_uses_injected_session_factory(
+        self, session_factory, sessions
+    ):
+        """Test that worker sessions come from the injected session factory."""
+        # Arrange
+        handler = get_pubsub_handler(
+            fmp_client=MagicMock(),
+            yfinance_client=MagicMock(),
+            session_factory=session_factory,
+        )
+
+        # Act
+        with patch.object(CompanySyncService, "upsert_company") as upsert_company:
+            handler._sync_symbol("AAPL")
+
+        # Assert
+        upsert_company.assert_called_once_with("AAPL")
+        assert len(sessions) == 1
+        sessions[0].close.assert_called_once_with()
@@ -0,0 +1,277 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.db.models.watchlist import Watchlist, WatchlistItem
+from app.schemas.user import WatchlistItemWrite
+from app.services import watchlist_service
+from app.services.watchlist_service import WatchlistService
+
+
+class TestWatchlistService:
+    """Test suite for WatchlistService."""
+
+    @pytest.fixture(autouse=True)
+    def clear_items_cache(self):
+        """Reset the module-level items cache between tests."""
+        watchlist_service.local_items_cache.clear()
+        yield
+        watchlist_service.local_items_cache.clear()
+
+    @pytest.fixture
+    def mock_watchlist_repo(self):
+        """Patch WatchlistRepository."""
+        with patch(
+            "app.services.watchlist_service.WatchlistRepository"
+        ) as mock_repo_class:
+            mock_repo = MagicMock()
+            mock_repo_class.return_value = mock_repo
+            yield mock_repo
+
+    @pytest.fixture
+    def service(self, mock_watchlist_repo):
+        """Create WatchlistService instance with mock session."""
+        return WatchlistService(MagicMock(spec=Session))
+
+    @staticmethod
+    def _watchlist_with_item(financial_ratios: list[dict]) -> Watchlist:
+        item = WatchlistItem(id=1, watchlist_id=1, symbol="AAPL")
+        item.set_company_profile(
+            {
+                "company_name": "Apple Inc.",
+                "currency": "USD",
+                "market_cap": 3_000_000_000_000.0,
+                "image": "https://example.com/aapl.png",
+                "financial_ratios": financial_ratios,
+                "stock_prices": [
+                    {"close_price": 190.0, "change": 1.5, "change_percent": 0.8}
+                ],
+            }
+        )
+        return Watchlist(id=1, user_id=1, name="Tech", items=[item])
+
+    def test_get_watchlist_items_surfaces_financial_ratios(
+        self, service, mock_watchlist_repo
+    ):
+        """Test that pre-loaded financial ratios are copied onto the response."""
+        # Arrange
+        ratios = {
+            "price_to_earnings_ratio": 29.5,
+            "price_to_earnings_growth_ratio": 2.1,
+            "forward_price_to_earnings_growth_ratio": 1.9,
+            "price_to_book_ratio": 45.0,
+            "price_to_sales_ratio": 7.6,
+            "price_to_free_cash_flow_ratio": 28.0,
+            "price_to_operating_cash_flow_ratio": 25.0,
+        }
+        mock_watchlist_repo.get_watchlist_items_version.return_value = 1
+        mock_watchlist_repo.get_watchlist_with_relations.return_value = (
+            self._watchlist_with_item([ratios])
+        )
+
+        # Act
+        result = service.get_watchlist_items(watchlist_id=1, user_id=1)
+
+        # Assert
+        assert len(result) == 1
+        item = result[0]
+        assert item.company_name == "Apple Inc."
+        assert item.price == 190.0
+        for key, value in ratios.items():
+            assert getattr(item, key) == value
+
+    def test_get_watchlist_items_without_ratios(self, service, mock_watchlist_repo):
+        """Test that missing financial ratios default to None."""
+        # Arrange
+        mock_watchlist_repo.get_watchlist_items_version.return_value = 1
+        mock_watchlist_repo.get_watchlist_with_relations.return_value = (
+            self._watchlist_with_item([])
+        )
+
+        # Act
+        result = service.get_watchlist_items(watchlist_id=1, user_id=1)
+
+        # Assert
+        assert result[0].price_to_earnings_ratio is None
+        assert result[0].price_to_book_ratio is None
+
+    def test_get_watchlist_items_access_denied(self, service, mock_watchlist_repo):
+        """Test that a watchlist owned by another user is rejected."""
+        # Arrange
+        mock_watchlist_repo.get_watchlist_items_version.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Watchlist not found or access denied"):
+            service.get_watchlist_items(watchlist_id=1, user_id=2)
+
+    @staticmethod
+    def _item_with_profile(item_id: int, symbol: str) -> WatchlistItem:
+        item = WatchlistItem(id=item_id, watchlist_id=1, symbol=symbol)
+        item.set_company_profile(
+            {
+                "company_name": symbol,
+                "currency": "USD",
+                "market_cap": 1.0,
+                "image": None,
+                "financial_ratios": [],
+                "stock_prices": [],
+            }
+        )
+        return item
+
+    def test_bulk_add_watchlist_items_skips_duplicates(
+        self, service, mock_watchlist_repo
+    ):
+        """Test that existing and repeated symbols are skipped, order preserved."""
+        # Arrange
+        mock_watchlist_repo.verify_watchlist_ownership.return_value = True
+        mock_watchlist_repo.get_existing_watchlist_symbols.return_value = {"AAPL"}
+        mock_watchlist_repo.bulk_add_watchlist_items.return_value = [
+            self._item_with_profile(2, "TSLA"),
+            self._item_with_profile(3, "MSFT"),
+        ]
+
+        # Act
+        result = service.bulk_add_watchlist_items(
+            watchlist_id=1, symbols=["TSLA", "AAPL", "MSFT", "TSLA"], user_id=1
+        )
+
+        # Assert
+        mock_watchlist_repo.get_existing_watchlist_symbols.assert_called_once_with(
+            1, ["TSLA", "AAPL", "MSFT"]
+        )
+        mock_watchlist_repo.bulk_add_watchlist_items.assert_called_once_with(
+            1, ["TSLA", "MSFT"]
+        )
+        assert [item.symbol for item in result] == ["TSLA", "MSFT"]
+
+    def test_bulk_add_watchlist_items_all_existing(self, service, mock_watchlist_repo):
+        """Test that nothing is inserted when every symbol already exists."""
+        # Arrange
+        mock_watchlist_repo.verify_watchlist_ownership.return_value = True
+        mock_watchlist_repo.get_existing_watchlist_symbols.return_value = {"AAPL"}
+
+        # Act
+        result = service.bulk_add_watchlist_items(
+            watchlist_id=1, symbols=["AAPL"], user_id=1
+        )
+
+        # Assert
+        assert result == []
+        mock_watchlist_repo.bulk_add_watchlist_items.assert_not_called()
+
+    def test_bulk_add_watchlist_items_access_denied(self, service, mock_watchlist_repo):
+        """Test that a watchlist owned by another user is rejected."""
+        # Arrange
+        mock_watchlist_repo.verify_watchlist_ownership.return_value = False
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Watchlist not found or access denied"):
+            service.bulk_add_watchlist_items(
+                watchlist_id=1, symbols=["AAPL"], user_id=2
+            )
+        mock_watchlist_repo.bulk_add_watchlist_items.assert_not_called()
+
+    def test_get_watchlist_items_cache_hit(self, service, mock_watchlist_repo):
+        """Test that an unchanged watchlist is served from the cache."""
+        # Arrange
+        mock_watchlist_repo.get_watchlist_items_version.return_value = 1
+        mock_watchlist_repo.get_watchlist_with_relations.return_value = (
+            self._watchlist_with_item([])
+        )
+        first = service.get_watchlist_items(watchlist_id=1, user_id=1)
+
+        # Act
+        second = service.get_watchlist_items(watchlist_id=1, user_id=1)
+
+        # Assert
+        assert second is first
+        mock_watchlist_repo.get_watchlist_with_relations.assert_called_once()
+
+    def test_get_watchlist_items_cache_miss_on_new_version(
+        self, service, mock_watchlist_repo
+    ):
+        """Test that a bumped items_version rebuilds the items."""
+        # Arrange
+        mock_watchlist_repo.get_watchlist_items_version.return_value = 1
+        mock_watchlist_repo.get_watchlist_with_relations.return_value = (
+            self._watchlist_with_item([])
+        )
+        service.get_watchlist_items(watchlist_id=1, user_id=1)
+        mock_watchlist_repo.get_watchlist_items_version.return_value = 2
+
+        # Act
+        service.get_watchlist_items(watchlist_id=1, user_id=1)
+
+        # Assert
+        assert mock_watchlist_repo.get_watchlist_with_relations.call_count == 2
+        assert watchlist_service.local_items_cache[1]["version"] == 2
+
+    def test_get_watchlist_items_cache_expires(self, service, mock_watchlist_repo):
+        """Test that an entry older than the timeout is dropped and rebuilt."""
+        # Arrange
+        mock_watchlist_repo.get_watchlist_items_version.return_value = 1
+        mock_watchlist_repo.get_watchlist_with_relations.return_value = (
+            self._watchlist_with_item([])
+        )
+        service.get_watchlist_items(watchlist_id=1, user_id=1)
+        watchlist_service.local_items_cache[1]["timestamp"] -= timedelta(
+            seconds=watchlist_service.ITEMS_CACHE_TIMEOUT_SECONDS
+        )
+
+        # Act
+        service.get_watchlist_items(watchlist_id=1, user_id=1)
+
+        # Assert
+        assert mock_watchlist_repo.get_watchlist_with_relations.call_count == 2
+
+    def test_items_cache_evicts_least_recently_used(self, service, mock_watchlist_repo):
+        """Test that the cache never grows past its size bound."""
+        # Arrange
+        mock_watchlist_repo.get_watchlist_items_version.return_value = 1
+        mock_watchlist_repo.get_watchlist_with_relations.return_value = (
+            self._watchlist_with_item([])
+        )
+
+        # Act
+        with patch.object(watchlist_service, "ITEMS_CACHE_MAX_ENTRIES", 2):
+            service.get_watchlist_items(watchlist_id=1, user_id=1)
+            service.get_watchlist_items(watchlist_id=2, user_id=1)
+            service.get_watchlist_items(watchlist_id=1, user_id=1)
+            service.get_watchlist_items(watchlist_id=3, user_id=1)
+
+        # Assert
+        assert list(watchlist_service.local_items_cache) == [1, 3]
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda service: service.add_watchlist_item(
+                1, WatchlistItemWrite(symbol="MSFT"), user_id=1
+            ),
+            lambda service: service.bulk_add_watchlist_items(1, ["MSFT"], user_id=1),
+            lambda service: service.delete_watchlist_item(1, 1, user_id=1),
+            lambda service: service.delete_watchlist(1, user_id=1),
+        ],
+        ids=["add", "bulk_add", "delete_item", "delete_watchlist"],
+    )
+    def test_writes_invalidate_items_cache(self, service, mock_watchlist_repo, write):
+        """Test that item writes and watchlist deletion drop the cached entry."""
+        # Arrange
+        mock_watchlist_repo.get_watchlist_items_version.return_value = 1
+        mock_watchlist_repo.get_watchlist_with_relations.return_value = (
+            self._watchlist_with_item([])
+        )
+        mock_watchlist_repo.check_owned_watchlist_item_exists.return_value = False
+        mock_watchlist_repo.verify_watchlist_ownership.return_value = True
+        mock_watchlist_repo.get_existing_watchlist_symbols.return_value = set()
+        mock_watchlist_repo.bulk_add_watchlist_items.return_value = []
+        service.get_watchlist_items(watchlist_id=1, user_id=1)
+
+        # Act
+        write(service)
+
+        # Assert
+        assert 1 not in watchlist_service.local_items_cache